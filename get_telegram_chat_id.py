@@ -32,13 +32,12 @@ def get_chat_id():
     print()
     
     # Create temporary notifier (chat_id not needed for this)
-    notifier = TelegramNotifier(bot_token=bot_token, chat_id="0")
-    
-    print("📡 Fetching recent messages from your bot...")
-    print()
-    
-    # Get chat ID
-    chat_id = notifier.get_chat_id()
+    with TelegramNotifier(bot_token=bot_token, chat_id="0") as notifier:
+        print("📡 Fetching recent messages from your bot...")
+        print()
+        
+        # Get chat ID (always ask Telegram; the result is cached for the monitor)
+        chat_id = notifier.get_chat_id(refresh=True)
     
     if chat_id:
         print("✅ Success! Your chat ID is:")
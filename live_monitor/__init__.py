@@ -3,14 +3,36 @@ Live Monitor Module
 
 Provides real-time monitoring capabilities for crypto trading signals.
 Analyzes market data every 4 hours and detects Ichimoku-based signals.
+
+Components are imported lazily on first access (PEP 562) so entry points
+that only touch part of the package don't pay for ccxt/pandas imports.
 """
 
-from .market_data_fetcher import MarketDataFetcher
-from .signal_detector import SignalDetector
-from .state_manager import StateManager
+import importlib
+
+_LAZY = {
+    'MarketDataFetcher': '.market_data_fetcher',
+    'SignalDetector': '.signal_detector',
+    'StateManager': '.state_manager',
+    'MonitorScheduler': '.scheduler',
+}
 
 __all__ = [
     'MarketDataFetcher',
     'SignalDetector',
     'StateManager',
+    'MonitorScheduler',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,16 +5,57 @@ Fetches real-time OHLCV data from Binance for signal analysis.
 Optimized for 4-hour timeframe monitoring with 250 candles.
 """
 
+import asyncio
+import os
 import ccxt
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 import logging
+import threading
 import time
 import random
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import TokenBucket, parse_retry_after, parse_used_weight
 
 logger = logging.getLogger(__name__)
 
+# Sync ccxt clients and their request-weight buckets shared by every
+# MarketDataFetcher, keyed by (exchange_name,)
+_EXCHANGE_REGISTRY: dict[tuple, tuple[ccxt.Exchange, TokenBucket]] = {}
+_EXCHANGE_REGISTRY_LOCK = threading.Lock()
+
+# Server-directed rate-limit pauses allowed per fetch (not counted against max_retries)
+_MAX_RATE_LIMIT_PAUSES = 3
+
+# Pause applied to every fetch after a 429/418 whose Retry-After could not be read
+_DEFAULT_RETRY_AFTER_SECONDS = 30.0
+
+
+def _get_shared_exchange(exchange_name: str, config: dict) -> tuple[ccxt.Exchange, TokenBucket]:
+    """
+    Return the process-wide ccxt client and token bucket for an exchange, creating them on first use.
+    
+    Reusing one client keeps its HTTP keep-alive connections (and TLS sessions)
+    warm across fetchers instead of re-handshaking for every new instance. The
+    bucket is shared the same way, since the exchange's weight limit is per IP.
+    """
+    key = (exchange_name,)
+    with _EXCHANGE_REGISTRY_LOCK:
+        entry = _EXCHANGE_REGISTRY.get(key)
+        if entry is None:
+            exchange = getattr(ccxt, exchange_name)(config)
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+            exchange.session.mount('https://', adapter)
+            # Binance allows 1200 request weight per minute; shared by sync and async fetches
+            entry = (exchange, TokenBucket(capacity=1200, refill_per_sec=20))
+            _EXCHANGE_REGISTRY[key] = entry
+        return entry
+
 
 class MarketDataFetcher:
     """
@@ -22,7 +63,7 @@ class MarketDataFetcher:
     Focused on 4h timeframe with sufficient historical data for Ichimoku calculation.
     """
     
-    def __init__(self, exchange_name: str = 'binance', *, max_retries: int = 0, retry_delay_seconds: int = 5, backoff_factor: float = 2.0):
+    def __init__(self, exchange_name: str = 'binance', *, max_retries: int = 0, retry_delay_seconds: int = 5, backoff_factor: float = 2.0, markets_ttl_seconds: int = 3600, cache_dir: Optional[str] = None, price_dtype: str = 'float64', reuse_buffers: bool = False):
         """
         Initialize market data fetcher.
         
@@ -31,19 +72,266 @@ class MarketDataFetcher:
             max_retries: Number of retries on transient network errors
             retry_delay_seconds: Base delay between retries
             backoff_factor: Exponential backoff multiplier
+            markets_ttl_seconds: How long loaded markets are reused by validate_symbols
+            cache_dir: Directory for the on-disk OHLCV cache (None disables caching).
+                       With a cache only candles newer than the last cached bar are fetched.
+            price_dtype: dtype of the OHLCV columns, 'float64' (default) or 'float32'.
+                         float32 halves the bytes the Ichimoku rolling windows read, but keeps
+                         only ~7 significant digits: above ~$100k prices are no longer exact
+                         to the cent (BTC at 100,000 resolves to ~0.008).
+            reuse_buffers: Parse each (symbol, timeframe) into a preallocated array that is
+                           overwritten on the next fetch. Returned DataFrames are views of that
+                           array, so callers must .copy() any frame they keep across fetches.
         """
-        self.exchange = getattr(ccxt, exchange_name)({
+        self.exchange_name = exchange_name
+        self.exchange, self._bucket = _get_shared_exchange(exchange_name, self._exchange_config())
+        self.max_retries = max(0, int(max_retries))
+        self.retry_delay_seconds = max(0, int(retry_delay_seconds))
+        self.backoff_factor = float(backoff_factor) if backoff_factor > 0 else 1.0
+        
+        # Markets cache for validate_symbols (load_markets pulls every market on the exchange)
+        self._markets_cache: Optional[dict] = None
+        self._markets_ts = 0.0
+        self._markets_ttl = max(0, int(markets_ttl_seconds))
+        
+        self.price_dtype = np.dtype(price_dtype)
+        if self.price_dtype not in (np.float32, np.float64):
+            raise ValueError(f"price_dtype must be float32 or float64, got {price_dtype}")
+        
+        self.reuse_buffers = reuse_buffers
+        self._buffers: dict[tuple, np.ndarray] = {}
+        
+        # Optional kline WebSocket feed (see start_streaming)
+        self._stream = None
+        
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        logger.info("Initialized MarketDataFetcher with %s", exchange_name)
+    
+    @staticmethod
+    def _exchange_config() -> dict:
+        """Shared ccxt client options for the sync and async exchange instances."""
+        return {
             'timeout': 30000,
-            'enableRateLimit': True,
+            # Throttling is handled by our token bucket instead of ccxt's fixed sleeps
+            'enableRateLimit': False,
             'options': {
                 'defaultType': 'spot',
             }
-        })
-        self.max_retries = max(0, int(max_retries))
-        self.retry_delay_seconds = max(0, int(retry_delay_seconds))
-        self.backoff_factor = float(backoff_factor) if backoff_factor > 0 else 1.0
+        }
+    
+    @staticmethod
+    def _ohlcv_to_df(ohlcv: list, symbol: str, price_dtype=np.float64, out: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Convert a raw ccxt OHLCV list into a timestamp-indexed DataFrame.
+        
+        Args:
+            ohlcv: List of [timestamp, open, high, low, close, volume] rows
+            symbol: Trading pair the rows belong to
+            price_dtype: dtype for the OHLCV columns (float64 or float32)
+            out: Optional float64 (rows, 6) buffer to parse into instead of allocating
+        
+        Returns:
+            DataFrame with OHLCV columns of price_dtype, timestamp index and
+            the symbol stored in df.attrs['symbol']
+        """
+        # Single float64 conversion (exact for ms timestamps); slicing columns skips pandas type inference
+        if out is not None:
+            arr = out[:len(ohlcv)]
+            arr[...] = ohlcv
+        else:
+            arr = np.asarray(ohlcv, dtype=np.float64)
+        index = pd.DatetimeIndex(
+            arr[:, 0].astype(np.int64).view('datetime64[ms]'),
+            name='timestamp'
+        )
+        values = arr[:, 1:].astype(price_dtype, copy=False)
+        df = pd.DataFrame(
+            {
+                'open': values[:, 0],
+                'high': values[:, 1],
+                'low': values[:, 2],
+                'close': values[:, 3],
+                'volume': values[:, 4],
+            },
+            index=index,
+            copy=False
+        )
+        
+        # Symbol identifier kept as metadata rather than a per-row object column
+        df.attrs['symbol'] = symbol
+        
+        return df
+    
+    @staticmethod
+    def _ohlcv_rows(df: pd.DataFrame) -> np.ndarray:
+        """Inverse of _ohlcv_to_df: (rows, 6) float64 array of [timestamp ms, open, high, low, close, volume]."""
+        timestamps = df.index.as_unit('ms').asi8
+        values = df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+        return np.column_stack([timestamps, values])
+    
+    def _to_df(self, ohlcv: list, symbol: str, timeframe: str) -> pd.DataFrame:
+        """Convert OHLCV rows using this fetcher's dtype and, if enabled, its reusable buffer."""
+        out = None
+        if self.reuse_buffers:
+            key = (symbol, timeframe)
+            out = self._buffers.get(key)
+            if out is None or len(out) < len(ohlcv):
+                out = np.empty((len(ohlcv), 6), dtype=np.float64)
+                self._buffers[key] = out
+        return self._ohlcv_to_df(ohlcv, symbol, self.price_dtype, out=out)
+    
+    def _record_rate_limit(self, exchange):
+        """
+        Sync the token bucket with the weight Binance reports as used.
+        
+        With concurrent fetches on the shared client the headers may belong to
+        another thread's response; the used weight is per IP, so any recent
+        reading is still valid for the clamp.
+        """
+        used = parse_used_weight(getattr(exchange, 'last_response_headers', None))
+        if used is not None:
+            self._bucket.sync_used_weight(used)
+    
+    def _apply_retry_after(self, exchange) -> float:
+        """
+        Pause all fetches until the Retry-After of a 429/418 response has elapsed.
+        
+        The shared client's last_response_headers can already hold another
+        thread's response; without a readable Retry-After every fetch still
+        backs off for _DEFAULT_RETRY_AFTER_SECONDS.
+        
+        Returns:
+            The pause applied, in seconds
+        """
+        retry_after = parse_retry_after(getattr(exchange, 'last_response_headers', None))
+        if retry_after is None:
+            retry_after = _DEFAULT_RETRY_AFTER_SECONDS
+        logger.warning("Rate limited by exchange, pausing requests for %.0fs", retry_after)
+        self._bucket.drain_until(time.monotonic() + retry_after)
+        return retry_after
+    
+    def _cache_path(self, symbol: str, timeframe: str) -> Path:
+        """Cache file for a (symbol, timeframe) pair."""
+        return self.cache_dir / f"{symbol.replace('/', '_')}_{timeframe}.npy"
+    
+    def _read_cache(self, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
+        """Load cached candles, or None if caching is off or the cache cannot cover limit bars."""
+        if self.cache_dir is None:
+            return None
+        path = self._cache_path(symbol, timeframe)
+        if not path.exists():
+            return None
+        try:
+            # Plain (rows, 6) float64 array; never unpickle files from the data directory
+            rows = np.load(path, allow_pickle=False)
+            if rows.ndim != 2 or rows.shape[1] != 6:
+                raise ValueError(f"unexpected shape {rows.shape}")
+        except Exception as e:
+            logger.warning("Ignoring unreadable OHLCV cache %s: %s", path, e)
+            return None
+        if len(rows) < limit:
+            return None
+        return self._ohlcv_to_df(rows, symbol, self.price_dtype)
+    
+    def _write_cache(self, df: pd.DataFrame, symbol: str, timeframe: str):
+        """Persist candles for the next incremental fetch."""
+        if self.cache_dir is None:
+            return
+        path = self._cache_path(symbol, timeframe)
+        tmp_file = path.with_suffix(path.suffix + '.tmp')
+        try:
+            # Temp file + rename, so a crash mid-write never leaves a truncated cache
+            with open(tmp_file, 'wb') as f:
+                np.save(f, self._ohlcv_rows(df), allow_pickle=False)
+            os.replace(tmp_file, path)
+        except Exception as e:
+            logger.warning("Failed to write OHLCV cache for %s: %s", symbol, e)
+    
+    def _request_ohlcv(self, symbol: str, timeframe: str, limit: int, since: Optional[int] = None) -> list:
+        """Single rate-limited fetch_ohlcv call on the sync exchange."""
+        self._bucket.acquire()
+        ohlcv = self.exchange.fetch_ohlcv(
+            symbol=symbol,
+            timeframe=timeframe,
+            since=since,
+            limit=limit
+        )
+        self._record_rate_limit(self.exchange)
+        return ohlcv
+    
+    def _fetch_candles(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        """
+        Fetch the latest limit candles, preferring the kline stream, then the on-disk cache.
+        
+        While streaming is active and fresh, candles come from memory with no REST call;
+        otherwise the REST result re-seeds the stream. With a usable cache only bars from the last cached timestamp onwards are
+        requested (the last cached bar was still forming, so it is refreshed too).
+        Falls back to a full fetch when the delta does not join the cached data.
+        """
+        stream = self._stream if self._stream is not None and self._stream.timeframe == timeframe else None
+        if stream is not None:
+            rows = stream.snapshot(symbol, limit)
+            if rows is not None:
+                logger.debug("Serving %s %s candles from kline stream", symbol, timeframe)
+                return self._to_df(rows, symbol, timeframe)
+        
+        df = self._fetch_candles_rest(symbol, timeframe, limit)
+        if stream is not None and not df.empty:
+            # (Re-)seed the stream window with the REST snapshot
+            stream.seed(symbol, self._ohlcv_rows(df).tolist())
+        return df
+    
+    def _fetch_candles_rest(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        """REST fetch of the latest limit candles, incremental on top of the disk cache."""
+        cached = self._read_cache(symbol, timeframe, limit)
+        if cached is not None:
+            last_ts = cached.index[-1]
+            delta = self._request_ohlcv(symbol, timeframe, limit, since=int(last_ts.value // 10**6))
+            # A full page means the gap since the last run exceeds the window
+            if 0 < len(delta) < limit:
+                new = self._to_df(delta, symbol, timeframe)
+                if new.index[0] == last_ts:
+                    df = pd.concat([cached.iloc[:-1], new]).iloc[-limit:]
+                    df.attrs['symbol'] = symbol
+                    self._write_cache(df, symbol, timeframe)
+                    logger.debug("Fetched %d new candles for %s on top of cache", len(new), symbol)
+                    return df
+            logger.info("OHLCV cache for %s %s is stale, refetching full window", symbol, timeframe)
+        
+        ohlcv = self._request_ohlcv(symbol, timeframe, limit)
+        if not ohlcv:
+            return pd.DataFrame()
+        df = self._to_df(ohlcv, symbol, timeframe)
+        self._write_cache(df, symbol, timeframe)
+        return df
+    
+    def start_streaming(self, symbols: list[str], timeframe: str = '4h', max_rows: int = 500):
+        """
+        Stream candles for the given symbols over WebSocket (ccxt.pro watch_ohlcv).
         
-        logger.info(f"Initialized MarketDataFetcher with {exchange_name}")
+        While the stream is fresh, fetch_latest_data() for these symbols and this
+        timeframe is served from memory; REST is only used to seed the window and
+        after a reconnect.
+        
+        Args:
+            symbols: Trading pairs to stream
+            timeframe: Candle timeframe to stream (default: '4h')
+            max_rows: Candles kept in memory per symbol (must cover the fetch limit)
+        """
+        from .ws_feed import KlineStreamFeed
+        
+        self.stop_streaming()
+        self._stream = KlineStreamFeed(self.exchange_name, self._exchange_config(), timeframe, max_rows=max_rows)
+        self._stream.start(symbols)
+    
+    def stop_streaming(self):
+        """Stop the kline stream, if running; later fetches use REST only."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream = None
     
     def fetch_latest_data(self, 
                          symbol: str, 
@@ -62,57 +350,57 @@ class MarketDataFetcher:
             DataFrame with OHLCV data and timestamp index
         """
         attempt = 0
+        rate_limit_pauses = 0
         last_err = None
         while True:
             try:
-                logger.info(f"Fetching {limit} candles of {timeframe} data for {symbol}")
+                logger.info("Fetching %d candles of %s data for %s", limit, timeframe, symbol)
                 
                 # Fetch OHLCV data
-                ohlcv = self.exchange.fetch_ohlcv(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    limit=limit
-                )
-                
-                if not ohlcv:
-                    logger.warning(f"No data received for {symbol}")
-                    return pd.DataFrame()
-                
-                # Convert to DataFrame
-                df = pd.DataFrame(
-                    ohlcv,
-                    columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                )
-                
-                # Convert timestamp to datetime
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                df.set_index('timestamp', inplace=True)
+                df = self._fetch_candles(symbol, timeframe, limit)
                 
-                # Add symbol identifier
-                df['symbol'] = symbol
+                if df.empty:
+                    logger.warning("No data received for %s", symbol)
+                    return df
                 
-                logger.info(f"Successfully fetched {len(df)} candles for {symbol}")
-                logger.debug(f"Data range: {df.index[0]} to {df.index[-1]}")
+                logger.info("Successfully fetched %d candles for %s", len(df), symbol)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Data range: %s to %s", df.index[0], df.index[-1])
                 
                 return df
                 
-            except (ccxt.NetworkError, ccxt.ExchangeNotAvailable, ccxt.DDoSProtection) as e:
+            except (ccxt.RateLimitExceeded, ccxt.DDoSProtection) as e:
+                # 429/418: wait exactly as long as the exchange asks instead of backing off blindly
+                last_err = e
+                retry_after = self._apply_retry_after(self.exchange)
+                if rate_limit_pauses < _MAX_RATE_LIMIT_PAUSES:
+                    delay = retry_after + random.uniform(0, 0.5)
+                    rate_limit_pauses += 1
+                    logger.warning(
+                        "Rate limited fetching %s OHLCV (pause %d/%d): %s. Retrying in %.1fs",
+                        symbol, rate_limit_pauses, _MAX_RATE_LIMIT_PAUSES, e, delay
+                    )
+                    time.sleep(delay)
+                    continue
+                logger.error("Rate limit error fetching data for %s: %s", symbol, e)
+                raise
+            except (ccxt.NetworkError, ccxt.ExchangeNotAvailable) as e:
                 last_err = e
                 if attempt < self.max_retries:
                     delay = self.retry_delay_seconds * (self.backoff_factor ** attempt)
                     delay += random.uniform(0, max(0.5, 0.5 * self.retry_delay_seconds))
                     attempt += 1
                     logger.warning(
-                        f"Transient error fetching {symbol} OHLCV (attempt {attempt}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay:.1f}s"
+                        "Transient error fetching %s OHLCV (attempt %d/%d): %s. Retrying in %.1fs",
+                        symbol, attempt, self.max_retries, e, delay
                     )
                     time.sleep(delay)
                     continue
-                logger.error(f"Network error fetching data for {symbol}: {e}")
+                logger.error("Network error fetching data for %s: %s", symbol, e)
                 raise
             except ccxt.ExchangeError as e:
                 # Do not retry on immediate exchange errors (bad params, etc.)
-                logger.error(f"Exchange error fetching data for {symbol}: {e}")
+                logger.error("Exchange error fetching data for %s: %s", symbol, e)
                 raise
             except Exception as e:
                 # Some network stacks propagate different exceptions
@@ -122,43 +410,157 @@ class MarketDataFetcher:
                     delay += random.uniform(0, max(0.5, 0.5 * self.retry_delay_seconds))
                     attempt += 1
                     logger.warning(
-                        f"Error fetching {symbol} OHLCV (attempt {attempt}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay:.1f}s"
+                        "Error fetching %s OHLCV (attempt %d/%d): %s. Retrying in %.1fs",
+                        symbol, attempt, self.max_retries, e, delay
                     )
                     time.sleep(delay)
                     continue
-                logger.error(f"Unexpected error fetching data for {symbol}: {e}")
+                logger.error("Unexpected error fetching data for %s: %s", symbol, e)
                 raise
     
+    def fetch_latest_data_batch(self,
+                                symbols: list[str],
+                                timeframe: str = '4h',
+                                limit: int = 250,
+                                max_workers: int = 8) -> dict[str, Union[pd.DataFrame, Exception]]:
+        """
+        Fetch the latest OHLCV data for several symbols in one call.
+        
+        Each symbol goes through fetch_latest_data() (stream, incremental cache,
+        retries and the shared rate limiter) on a thread pool, so request
+        latencies overlap on the shared keep-alive connections. A failing symbol
+        gets its exception in place of a DataFrame instead of aborting the rest.
+        
+        Args:
+            symbols: List of trading pairs
+            timeframe: Timeframe for candles (default: '4h')
+            limit: Number of candles to fetch (default: 250)
+            max_workers: Maximum number of symbols fetched at once
+        
+        Returns:
+            Dictionary mapping symbol to DataFrame or the exception raised, in symbols order
+        """
+        if not symbols:
+            return {}
+        
+        workers = max(1, min(len(symbols), int(max_workers)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as pool:
+            futures = {
+                symbol: pool.submit(self.fetch_latest_data, symbol, timeframe, limit)
+                for symbol in symbols
+            }
+        
+        results = {}
+        for symbol, future in futures.items():
+            error = future.exception()
+            results[symbol] = error if error is not None else future.result()
+        return results
+    
     def fetch_multiple_symbols(self, 
                               symbols: list[str], 
                               timeframe: str = '4h', 
-                              limit: int = 250) -> dict[str, pd.DataFrame]:
+                              limit: int = 250,
+                              max_workers: int = 5) -> dict[str, pd.DataFrame]:
         """
-        Fetch data for multiple symbols.
+        Fetch data for multiple symbols concurrently.
+        
+        Runs through fetch_latest_data_batch(), so each symbol keeps the stream,
+        incremental cache and retries of fetch_latest_data(). Failed or empty
+        symbols are logged and left out of the result.
         
         Args:
             symbols: List of trading pairs (e.g., ['BTC/USDT', 'ETH/USDT', 'SOL/USDT'])
             timeframe: Timeframe for candles (default: '4h')
             limit: Number of candles to fetch (default: 250)
+            max_workers: Maximum number of symbols fetched at once
         
         Returns:
             Dictionary mapping symbol to DataFrame
         """
         results = {}
         
-        for symbol in symbols:
-            try:
-                df = self.fetch_latest_data(symbol, timeframe, limit)
-                if not df.empty:
-                    results[symbol] = df
-            except Exception as e:
-                logger.error(f"Failed to fetch data for {symbol}: {e}")
+        fetched = self.fetch_latest_data_batch(symbols, timeframe, limit, max_workers=max_workers)
+        for symbol, df in fetched.items():
+            if isinstance(df, Exception):
+                logger.error("Failed to fetch data for %s: %s", symbol, df)
                 # Continue with other symbols
                 continue
+            if not df.empty:
+                results[symbol] = df
         
         return results
     
+    async def fetch_multiple_symbols_async(self,
+                                           symbols: list[str],
+                                           timeframe: str = '4h',
+                                           limit: int = 250,
+                                           max_workers: int = 5) -> dict[str, pd.DataFrame]:
+        """
+        Fetch data for multiple symbols concurrently using ccxt.async_support.
+        
+        Opt-in for callers that already run an event loop. Each call opens its
+        own async client and issues one plain REST request per symbol: it
+        bypasses the kline stream, the incremental disk cache and the retries
+        of fetch_latest_data(). Prefer fetch_multiple_symbols() otherwise.
+        
+        Args:
+            symbols: List of trading pairs
+            timeframe: Timeframe for candles (default: '4h')
+            limit: Number of candles to fetch (default: 250)
+            max_workers: Maximum number of requests in flight at once
+        
+        Returns:
+            Dictionary mapping symbol to DataFrame (failed symbols are omitted)
+        """
+        # Imported here: the async client stack is only needed on this path
+        import ccxt.async_support as ccxt_async
+        exchange = getattr(ccxt_async, self.exchange_name)(self._exchange_config())
+        sem = asyncio.Semaphore(max(1, int(max_workers)))
+        try:
+            frames = await asyncio.gather(
+                *[self._bounded_fetch(exchange, sem, s, timeframe, limit) for s in symbols],
+                return_exceptions=True
+            )
+        finally:
+            # Release the underlying aiohttp session
+            await exchange.close()
+        
+        results = {}
+        for symbol, df in zip(symbols, frames):
+            if isinstance(df, BaseException):
+                logger.error("Failed to fetch data for %s: %s", symbol, df)
+                # Continue with other symbols
+                continue
+            if not df.empty:
+                results[symbol] = df
+        
+        return results
+    
+    async def _bounded_fetch(self,
+                             exchange,
+                             sem: asyncio.Semaphore,
+                             symbol: str,
+                             timeframe: str,
+                             limit: int) -> pd.DataFrame:
+        """Fetch one symbol's OHLCV on the async exchange while holding the semaphore."""
+        async with sem:
+            logger.info("Fetching %d candles of %s data for %s", limit, timeframe, symbol)
+            await self._bucket.acquire_async()
+            try:
+                ohlcv = await exchange.fetch_ohlcv(symbol=symbol, timeframe=timeframe, limit=limit)
+            except (ccxt.RateLimitExceeded, ccxt.DDoSProtection):
+                self._apply_retry_after(exchange)
+                raise
+            self._record_rate_limit(exchange)
+        
+        if not ohlcv:
+            logger.warning("No data received for %s", symbol)
+            return pd.DataFrame()
+        
+        df = self._to_df(ohlcv, symbol, timeframe)
+        logger.info("Successfully fetched %d candles for %s", len(df), symbol)
+        return df
+    
     def get_latest_price(self, symbol: str) -> Optional[float]:
         """
         Get the latest ticker price for a symbol.
@@ -169,12 +571,28 @@ class MarketDataFetcher:
         Returns:
             Latest price or None if error
         """
+        return self.get_latest_prices([symbol]).get(symbol)
+    
+    def get_latest_prices(self, symbols: list[str]) -> dict[str, Optional[float]]:
+        """
+        Get the latest ticker prices for several symbols in one request.
+        
+        Args:
+            symbols: List of trading pairs (e.g., ['BTC/USDT', 'ETH/USDT'])
+        
+        Returns:
+            Dictionary mapping symbol to latest price (None if unavailable)
+        """
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
-            return ticker.get('last')
+            if len(symbols) == 1:
+                tickers = {symbols[0]: self.exchange.fetch_ticker(symbols[0])}
+            else:
+                tickers = self.exchange.fetch_tickers(symbols)
         except Exception as e:
-            logger.error(f"Error fetching ticker for {symbol}: {e}")
-            return None
+            logger.error("Error fetching tickers for %s: %s", ', '.join(symbols), e)
+            return {symbol: None for symbol in symbols}
+        
+        return {symbol: (tickers.get(symbol) or {}).get('last') for symbol in symbols}
     
     def validate_symbols(self, symbols: list[str]) -> dict[str, bool]:
         """
@@ -187,16 +605,23 @@ class MarketDataFetcher:
             Dictionary mapping symbol to validity status
         """
         try:
-            markets = self.exchange.load_markets()
-            results = {}
+            if self._markets_cache is None or time.time() - self._markets_ts > self._markets_ttl:
+                # First load may reuse markets ccxt already fetched; expiry forces a refresh
+                self._markets_cache = self.exchange.load_markets(reload=self._markets_cache is not None)
+                self._markets_ts = time.time()
+            markets = self._markets_cache
             
-            for symbol in symbols:
-                results[symbol] = symbol in markets
-                if not results[symbol]:
-                    logger.warning(f"Symbol {symbol} not found on exchange")
+            results = {symbol: symbol in markets for symbol in symbols}
+            for symbol, valid in results.items():
+                if not valid:
+                    logger.warning("Symbol %s not found on exchange", symbol)
             
             return results
             
         except Exception as e:
-            logger.error(f"Error validating symbols: {e}")
+            logger.error("Error validating symbols: %s", e)
             return {symbol: False for symbol in symbols}
+    
+    def invalidate_markets_cache(self):
+        """Force the next validate_symbols() call to reload markets from the exchange."""
+        self._markets_ts = 0.0
@@ -0,0 +1,132 @@
+"""
+Rate Limiter for Exchange Requests
+
+Token bucket sized to Binance's request-weight budget (1200 weight per minute).
+Lets concurrent fetches burst up to the budget instead of ccxt's fixed
+per-call sleep, and pauses all callers after a 429/418 until Retry-After.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Mapping, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from both sync and async code.
+
+    Tokens refill continuously at refill_per_sec up to capacity. Each request
+    consumes its weight; callers wait when the bucket is empty or drained.
+    """
+
+    def __init__(self, capacity: float = 1200, refill_per_sec: float = 20):
+        """
+        Initialize token bucket.
+
+        Args:
+            capacity: Maximum tokens (request weight) available in a burst
+            refill_per_sec: Tokens restored per second
+        """
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens accrued since the last update (caller holds the lock)."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+            self._updated = now
+
+    def _reserve(self, weight: float) -> float:
+        """Take weight tokens if available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._refill(now)
+            if self._tokens >= weight:
+                self._tokens -= weight
+                return 0.0
+            return (weight - self._tokens) / self.refill_per_sec
+
+    def acquire(self, weight: float = 1):
+        """Block the calling thread until weight tokens are available."""
+        while True:
+            wait = self._reserve(weight)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, weight: float = 1):
+        """Wait (without blocking the event loop) until weight tokens are available."""
+        while True:
+            wait = self._reserve(weight)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def drain_until(self, deadline: float):
+        """
+        Empty the bucket and refuse tokens until the given monotonic deadline.
+
+        Args:
+            deadline: time.monotonic() value at which requests may resume
+        """
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = max(self._updated, deadline)
+            self._blocked_until = max(self._blocked_until, deadline)
+
+    def sync_used_weight(self, used_weight: float):
+        """Clamp available tokens to what the exchange reports as remaining."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, max(0.0, self.capacity - used_weight))
+
+
+def parse_retry_after(headers: Optional[Mapping]) -> Optional[float]:
+    """
+    Extract the Retry-After delay in seconds from response headers.
+
+    Args:
+        headers: Response headers (any casing)
+
+    Returns:
+        Delay in seconds or None if absent/unparseable
+    """
+    value = _header(headers, 'retry-after')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_used_weight(headers: Optional[Mapping]) -> Optional[float]:
+    """Extract Binance's X-MBX-USED-WEIGHT-1M value from response headers."""
+    value = _header(headers, 'x-mbx-used-weight-1m')
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _header(headers: Optional[Mapping], name: str) -> Optional[str]:
+    """Case-insensitive header lookup."""
+    if not headers:
+        return None
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
@@ -5,13 +5,18 @@ Schedules analysis tasks to run at specific times every 4 hours.
 Runs at 00:00:15, 04:00:15, 08:00:15, 12:00:15, 16:00:15, 20:00:15 UTC.
 """
 
+import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Callable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Longest single wait; bounds how late a run can be if the host suspends mid-wait
+_MAX_WAIT_SECONDS = 3600
+
 
 def _next_4h_boundary_utc(now: datetime) -> datetime:
     """Compute the next 4h boundary in UTC at :00:15 seconds.
@@ -59,21 +64,40 @@ class MonitorScheduler:
         self.analysis_function = analysis_function
         self.is_running = False
         self._next_run_utc: Optional[datetime] = None
+        self._stop_event = threading.Event()
+        # Upcoming boundaries, refilled a day at a time
+        self._boundary_queue: deque[datetime] = deque()
 
         logger.info("Initialized MonitorScheduler")
 
+    def _refill_boundaries(self, after: datetime):
+        """Queue the next 6 boundaries (one day) strictly after the given time."""
+        base = _next_4h_boundary_utc(after)
+        self._boundary_queue.extend(base + timedelta(hours=4 * i) for i in range(6))
+
+    def _next_boundary(self) -> datetime:
+        """Pop the next boundary still in the future, refilling the queue as needed."""
+        now = datetime.now(timezone.utc)
+        # Skip boundaries missed while a run was in progress or the host was suspended
+        while self._boundary_queue and self._boundary_queue[0] <= now:
+            self._boundary_queue.popleft()
+        if not self._boundary_queue:
+            after = max(now, self._next_run_utc) if self._next_run_utc else now
+            self._refill_boundaries(after)
+        return self._boundary_queue.popleft()
+
     def _run_with_logging(self):
         """Wrapper to run analysis with logging."""
-        start_time = datetime.now(timezone.utc)
-        logger.info(f"Starting scheduled analysis at {start_time.isoformat()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting scheduled analysis at %s", datetime.now(timezone.utc).isoformat())
+        start = time.perf_counter()
 
         try:
             self.analysis_function()
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
-            logger.info(f"Completed scheduled analysis in {duration:.2f} seconds")
+            duration = time.perf_counter() - start
+            logger.info("Completed scheduled analysis in %.2f seconds", duration)
         except Exception as e:
-            logger.error(f"Error in scheduled analysis: {e}", exc_info=True)
+            logger.error("Error in scheduled analysis: %s", e, exc_info=True)
             # Don't raise - allow scheduler to continue
 
     def run_immediately(self):
@@ -96,36 +120,43 @@ class MonitorScheduler:
             self.run_immediately()
 
         self.is_running = True
+        self._stop_event.clear()
         logger.info("Scheduler started, entering main loop (UTC-aligned 4h schedule)")
 
         # Initialize next run strictly in UTC
-        self._next_run_utc = _next_4h_boundary_utc(datetime.now(timezone.utc))
-        logger.info(f"Next run scheduled at {self._next_run_utc.isoformat()} (UTC)")
+        self._boundary_queue.clear()
+        self._next_run_utc = self._next_boundary()
+        logger.info("Next run scheduled at %s (UTC)", self._next_run_utc.isoformat())
 
         while self.is_running:
             try:
-                now = datetime.now(timezone.utc)
-                if self._next_run_utc and now >= self._next_run_utc:
-                    self._run_with_logging()
-                    # Compute the subsequent run
-                    self._next_run_utc = _next_4h_boundary_utc(datetime.now(timezone.utc))
-                    logger.info(f"Next run scheduled at {self._next_run_utc.isoformat()} (UTC)")
-                # Sleep a short time to avoid drift; wake up frequently near boundary
-                sleep_seconds = max(5, min(60, int((self._next_run_utc - now).total_seconds() - 1))) if self._next_run_utc else 30
-                time.sleep(sleep_seconds)
+                wait_seconds = (self._next_run_utc - datetime.now(timezone.utc)).total_seconds()
+                if wait_seconds > 0:
+                    # Sleep until the boundary in one wait; stop() wakes us immediately
+                    if self._stop_event.wait(min(wait_seconds, _MAX_WAIT_SECONDS)):
+                        break
+                    # Re-check against the wall clock in case the wait returned early
+                    continue
+                self._run_with_logging()
+                # Take the subsequent run from the precomputed queue
+                self._next_run_utc = self._next_boundary()
+                logger.info("Next run scheduled at %s (UTC)", self._next_run_utc.isoformat())
             except KeyboardInterrupt:
                 logger.info("Received keyboard interrupt")
                 self.stop()
                 break
             except Exception as e:
-                logger.error(f"Error in scheduler main loop: {e}", exc_info=True)
-                time.sleep(30)
+                logger.error("Error in scheduler main loop: %s", e, exc_info=True)
+                if self._stop_event.wait(30):
+                    break
 
     def stop(self):
         """Stop the scheduler."""
         logger.info("Stopping scheduler")
         self.is_running = False
         self._next_run_utc = None
+        self._boundary_queue.clear()
+        self._stop_event.set()
 
     def get_next_run(self) -> Optional[datetime]:
         """
@@ -171,5 +202,5 @@ class OneTimeScheduler:
             self.analysis_function()
             logger.info("One-time analysis completed successfully")
         except Exception as e:
-            logger.error(f"Error in one-time analysis: {e}", exc_info=True)
+            logger.error("Error in one-time analysis: %s", e, exc_info=True)
             raise
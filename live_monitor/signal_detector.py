@@ -11,24 +11,51 @@ Architecture:
 - Monitoring only - does NOT execute actual trades
 """
 
+import os
+import threading
 import pandas as pd
 import yaml
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Tuple
 import logging
 from dataclasses import dataclass
 
+try:
+    # LibYAML's C parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from strategy.ichimoku_strategy import (
     UnifiedIchimokuAnalyzer,
     IchimokuParameters,
     SignalType,
-    StrategyRules
+    StrategyRules,
+    cloud_color,
+    row_signal_bits
 )
 
 logger = logging.getLogger(__name__)
 
+# Parsed strategy configs keyed by resolved path: (mtime_ns, config, parameters, rules)
+_PARSED_CONFIGS: Dict[str, Tuple[int, Dict, IchimokuParameters, StrategyRules]] = {}
+# Detectors handed out by SignalDetector.shared(), keyed by resolved path
+_SHARED_DETECTORS: Dict[str, 'SignalDetector'] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+# Float Ichimoku columns reported with each signal (None when NaN/missing)
+_REPORT_COLUMNS = (
+    'tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b',
+    'chikou_span', 'cloud_top', 'cloud_bottom',
+)
+
+
+def _default_strategy_config_path() -> Path:
+    return Path(__file__).parent.parent / 'config' / 'strategy.yaml'
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SignalResult:
     """Result of signal detection."""
     signal_type: str  # "LONG", "SHORT", "EXIT LONG", "EXIT SHORT", "NONE"
@@ -62,27 +89,89 @@ class SignalDetector:
         
         # Load strategy configuration
         if strategy_config_path is None:
-            config_dir = Path(__file__).parent.parent / 'config'
-            strategy_config_path = config_dir / 'strategy.yaml'
+            strategy_config_path = _default_strategy_config_path()
+        
+        # Reuse the parsed config/rules when the file is unchanged since it was last parsed
+        config_key = str(Path(strategy_config_path).resolve())
+        try:
+            mtime_ns = os.stat(config_key).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cached = _PARSED_CONFIGS.get(config_key)
         
-        self.strategy_config = self._load_strategy_config(strategy_config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            _, self.strategy_config, self.parameters, self.strategy_rules = cached
+            self.strategy = self.strategy_config['strategies']['ichimoku_default']
+        else:
+            self.strategy_config = self._load_strategy_config(strategy_config_path)
+            
+            # Use ichimoku_default by default
+            self.strategy = self.strategy_config['strategies']['ichimoku_default']
+            
+            # Parse Ichimoku parameters
+            self.parameters = self._parse_ichimoku_parameters()
+            
+            # Parse strategy rules (long/short entry/exit)
+            self.strategy_rules = self._parse_strategy_rules()
+            
+            if mtime_ns is not None:
+                with _CACHE_LOCK:
+                    _PARSED_CONFIGS[config_key] = (
+                        mtime_ns, self.strategy_config, self.parameters, self.strategy_rules
+                    )
         
-        # Use ichimoku_default by default
-        self.strategy = self.strategy_config['strategies']['ichimoku_default']
+        # SIGNAL_BITS mask per rule set, resolved when the rules were built
+        self._rule_masks = self.strategy_rules.rule_masks
         
-        # Parse Ichimoku parameters
-        self.parameters = self._parse_ichimoku_parameters()
+        # Bars needed before the cloud (senkou_b projected forward) exists at the closed bar
+        self._min_bars = max(
+            self.parameters.senkou_b_period + self.parameters.senkou_offset,
+            self.parameters.chikou_offset
+        ) + 1
         
-        # Parse strategy rules (long/short entry/exit)
-        self.strategy_rules = self._parse_strategy_rules()
+        # Last result per symbol, keyed by (timestamp, close) of the last closed bar
+        self._signal_cache: Dict[str, Tuple[pd.Timestamp, float, SignalResult]] = {}
         
         logger.info(f"Initialized SignalDetector with strategy: {self.strategy['name']}")
     
+    @classmethod
+    def shared(cls, strategy_config_path: Optional[str] = None) -> 'SignalDetector':
+        """
+        Get a process-wide detector for a strategy config, creating it on first use.
+        
+        The detector is rebuilt if the config file has changed since it was created.
+        
+        Args:
+            strategy_config_path: Path to strategy.yaml file
+                                 If None, uses default config/strategy.yaml
+        
+        Returns:
+            Shared SignalDetector instance
+        """
+        if strategy_config_path is None:
+            strategy_config_path = _default_strategy_config_path()
+        config_key = str(Path(strategy_config_path).resolve())
+        
+        with _CACHE_LOCK:
+            detector = _SHARED_DETECTORS.get(config_key)
+            cached = _PARSED_CONFIGS.get(config_key)
+        if detector is not None and cached is not None:
+            try:
+                if os.stat(config_key).st_mtime_ns == cached[0]:
+                    return detector
+            except OSError:
+                return detector
+        
+        detector = cls(config_key)
+        with _CACHE_LOCK:
+            _SHARED_DETECTORS[config_key] = detector
+        return detector
+    
     def _load_strategy_config(self, config_path: Path) -> Dict:
         """Load strategy configuration from YAML file."""
         try:
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
             logger.info(f"Loaded strategy configuration from {config_path}")
             return config
         except Exception as e:
@@ -97,7 +186,8 @@ class SignalDetector:
             kijun_period=params['kijun_period'],
             senkou_b_period=params['senkou_b_period'],
             chikou_offset=params['chikou_offset'],
-            senkou_offset=params['senkou_offset']
+            senkou_offset=params['senkou_offset'],
+            dtype=params.get('dtype')
         )
     
     def _parse_strategy_rules(self) -> StrategyRules:
@@ -140,53 +230,170 @@ class SignalDetector:
         Returns:
             SignalResult with detected signal type and details
         """
-        try:
-            # Calculate Ichimoku components
-            ichimoku_df = self.analyzer.calculate_ichimoku_components(
-                data, self.parameters
-            )
-            
-            # Detect boolean signals
-            signals_df = self.analyzer.detect_boolean_signals(
-                ichimoku_df, self.parameters
-            )
-            
-            # Use check_position_signals to evaluate all entry/exit conditions
-            position_signals = self.analyzer.check_position_signals(
-                signals_df, self.strategy_rules
-            )
-            
-            # Get latest completed bar (second to last)
-            latest_idx = -2 if len(signals_df) > 1 else -1
-            latest = signals_df.iloc[latest_idx]
-            
-            # Determine signal type from position signals
-            signal_type, confidence = self._determine_signal_type(
-                position_signals, latest
-            )
-            
-            # Extract Ichimoku values for reporting
-            ichimoku_values = self._extract_ichimoku_values(latest)
-            
-            result = SignalResult(
-                signal_type=signal_type,
-                symbol=symbol,
-                timestamp=position_signals['timestamp'],
-                confidence=confidence,
-                details=position_signals,
-                ichimoku_values=ichimoku_values
-            )
-            
-            logger.debug(f"Detected {signal_type} signal for {symbol} with confidence {confidence:.2%}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error detecting signal for {symbol}: {e}")
-            raise
+        if len(data) < self._min_bars:
+            return self._insufficient_data_result(data, symbol)
+        
+        # The last closed bar only depends on the trailing history window,
+        # so an unchanged closed bar gives the same result as last time
+        bar_key = self._closed_bar_key(data)
+        cached = self._signal_cache.get(symbol)
+        if cached is not None and cached[:2] == bar_key:
+            return cached[2]
+        
+        window = self.required_history()
+        if len(data) > window:
+            data = data.iloc[-window:]
+        
+        # Calculate Ichimoku components and boolean signals
+        signals_df = self.analyzer.calculate_signals(data, self.parameters)
+        
+        return self._build_result(signals_df, symbol, bar_key)
+    
+    def detect_signals_batch(self, data_by_symbol: Dict[str, pd.DataFrame]) -> Dict[str, SignalResult]:
+        """
+        Detect signals for several symbols with a single indicator pass.
+        
+        Symbols with at least required_history() bars are trimmed to exactly that
+        window and stacked into one frame. Each symbol's closed bar only depends on
+        its own window, so one calculation over the stack gives the same results as
+        per-symbol calls while paying pandas' per-operation overhead once.
+        Cached symbols and shorter histories go through detect_signal.
+        
+        Args:
+            data_by_symbol: Dictionary mapping symbol to OHLCV DataFrame
+        
+        Returns:
+            Dictionary mapping symbol to SignalResult
+        """
+        results = {}
+        window = self.required_history()
+        batch = {}
+        
+        for symbol, data in data_by_symbol.items():
+            cached = self._signal_cache.get(symbol)
+            if len(data) >= window and (cached is None or cached[:2] != self._closed_bar_key(data)):
+                batch[symbol] = data.iloc[-window:]
+            else:
+                results[symbol] = self.detect_signal(data, symbol)
+        
+        if len(batch) == 1:
+            symbol, data = batch.popitem()
+            results[symbol] = self.detect_signal(data, symbol)
+        if not batch:
+            return results
+        
+        stacked = pd.concat(batch.values())
+        signals_df = self.analyzer.calculate_signals(stacked, self.parameters)
+        
+        for i, (symbol, data) in enumerate(batch.items()):
+            block = signals_df.iloc[i * window:(i + 1) * window]
+            results[symbol] = self._build_result(block, symbol, self._closed_bar_key(data))
+        
+        return results
+    
+    def cached_signal(self, data: pd.DataFrame, symbol: str) -> Optional[SignalResult]:
+        """
+        Get the cached result for data's last closed bar without computing anything.
+        
+        Returns:
+            SignalResult from an earlier detection of the same closed bar, or None
+        """
+        if len(data) < self._min_bars:
+            return None
+        cached = self._signal_cache.get(symbol)
+        if cached is not None and cached[:2] == self._closed_bar_key(data):
+            return cached[2]
+        return None
+    
+    def remember_signal(self, data: pd.DataFrame, symbol: str, result: SignalResult):
+        """Cache a result computed elsewhere (e.g., in a worker process) for data's closed bar."""
+        if len(data) >= self._min_bars:
+            self._signal_cache[symbol] = (*self._closed_bar_key(data), result)
+    
+    def _insufficient_data_result(self, data: pd.DataFrame, symbol: str) -> SignalResult:
+        """NONE result for a history too short to have a complete cloud at the closed bar."""
+        if len(data) == 0:
+            raise ValueError(f"No data for {symbol}")
+        
+        logger.warning(f"Only {len(data)} bars for {symbol} (need {self._min_bars}), skipping signal detection")
+        closed_idx = -2 if len(data) > 1 else -1
+        timestamp = data.index[closed_idx]
+        return SignalResult(
+            signal_type="NONE",
+            symbol=symbol,
+            timestamp=timestamp,
+            confidence=0.0,
+            details={
+                "long_entry": False, "short_entry": False,
+                "long_exit": False, "short_exit": False,
+                "timestamp": timestamp
+            },
+            ichimoku_values=self._extract_ichimoku_values({'close': data['close'].iloc[closed_idx]})
+        )
+    
+    @staticmethod
+    def _closed_bar_key(data: pd.DataFrame) -> Tuple[pd.Timestamp, float]:
+        """(timestamp, close) of the last closed bar, used to key the result cache."""
+        closed_idx = -2 if len(data) > 1 else -1
+        return data.index[closed_idx], float(data['close'].iloc[closed_idx])
+    
+    def _build_result(self,
+                      signals_df: pd.DataFrame,
+                      symbol: str,
+                      bar_key: Tuple[pd.Timestamp, float]) -> SignalResult:
+        """Evaluate strategy rules on the last closed bar of signals_df and cache the result."""
+        # Get latest completed bar (second to last)
+        latest_idx = -2 if len(signals_df) > 1 else -1
+        latest = self._row_values(signals_df, latest_idx)
+        
+        # Use check_position_signals to evaluate all entry/exit conditions
+        # bar_key already holds the closed bar's timestamp
+        position_signals = self.analyzer.check_position_signals(
+            signals_df, self.strategy_rules, latest=latest, timestamp=bar_key[0]
+        )
+        
+        # Determine signal type from position signals
+        signal_type, confidence = self._determine_signal_type(
+            position_signals, latest
+        )
+        
+        # Extract Ichimoku values for reporting
+        ichimoku_values = self._extract_ichimoku_values(latest)
+        
+        result = SignalResult(
+            signal_type=signal_type,
+            symbol=symbol,
+            timestamp=position_signals['timestamp'],
+            confidence=confidence,
+            details=position_signals,
+            ichimoku_values=ichimoku_values
+        )
+        
+        self._signal_cache[symbol] = (*bar_key, result)
+        
+        logger.debug(f"Detected {signal_type} signal for {symbol} with confidence {confidence:.2%}")
+        return result
+    
+    def required_history(self) -> int:
+        """
+        Number of trailing bars needed to evaluate the last closed bar exactly.
+        
+        Chikou-vs-cloud compares against the cloud chikou_offset bars back, which is
+        itself projected senkou_offset bars forward from the longest rolling window.
+        One extra bar covers the open (incomplete) candle.
+        """
+        p = self.parameters
+        longest = max(p.tenkan_period, p.kijun_period, p.senkou_b_period)
+        return p.chikou_offset + p.senkou_offset + longest + 1
+    
+    @staticmethod
+    def _row_values(df: pd.DataFrame, idx: int) -> Dict:
+        """Extract one row as a plain {column: value} dict (single positional read)."""
+        return dict(zip(df.columns, df.iloc[idx].to_numpy()))
     
     def _determine_signal_type(self, 
                                position_signals: Dict, 
-                               latest_row: pd.Series) -> Tuple[str, float]:
+                               latest_row: Dict) -> Tuple[str, float]:
         """
         Determine signal type from position_signals (long/short entry/exit).
         
@@ -200,61 +407,51 @@ class SignalDetector:
         Returns:
             Tuple of (signal_type, confidence)
         """
+        bar_bits = self._bar_bits(latest_row)
+        
         # Priority: Entry signals first, then exit signals
         if position_signals['long_entry']:
-            confidence = self._calculate_confidence(
-                self.strategy_rules.long_entry, latest_row
-            )
+            confidence = self._calculate_confidence('long_entry', bar_bits)
             return "LONG", confidence
         
         elif position_signals['short_entry']:
-            confidence = self._calculate_confidence(
-                self.strategy_rules.short_entry, latest_row
-            )
+            confidence = self._calculate_confidence('short_entry', bar_bits)
             return "SHORT", confidence
         
         elif position_signals['long_exit']:
-            confidence = self._calculate_confidence(
-                self.strategy_rules.long_exit, latest_row
-            )
+            confidence = self._calculate_confidence('long_exit', bar_bits)
             return "EXIT LONG", confidence
         
         elif position_signals['short_exit']:
-            confidence = self._calculate_confidence(
-                self.strategy_rules.short_exit, latest_row
-            )
+            confidence = self._calculate_confidence('short_exit', bar_bits)
             return "EXIT SHORT", confidence
         
         else:
             # No actionable signal
             return "NONE", 0.0
     
-    def _calculate_confidence(self, conditions: List[SignalType], latest_row: pd.Series) -> float:
+    def _bar_bits(self, latest_row: Dict) -> int:
+        """The bar's packed signal bits (bit set = signal active)."""
+        return row_signal_bits(latest_row)
+    
+    def _calculate_confidence(self, rule_name: str, bar_bits: int) -> float:
         """Calculate confidence based on percentage of conditions met."""
+        conditions = getattr(self.strategy_rules, rule_name)
         if not conditions:
             return 0.0
         
-        met = 0
-        for condition in conditions:
-            column_name = self.analyzer.signal_mapping.get(condition)
-            if column_name and latest_row.get(column_name, False):
-                met += 1
-        
+        met = (bar_bits & self._rule_masks[rule_name]).bit_count()
         return met / len(conditions)
     
-    def _extract_ichimoku_values(self, latest_row: pd.Series) -> Dict:
+    def _extract_ichimoku_values(self, latest_row: Dict) -> Dict:
         """Extract Ichimoku indicator values for reporting."""
-        return {
-            'close': float(latest_row['close']),
-            'tenkan_sen': float(latest_row['tenkan_sen']) if pd.notna(latest_row['tenkan_sen']) else None,
-            'kijun_sen': float(latest_row['kijun_sen']) if pd.notna(latest_row['kijun_sen']) else None,
-            'senkou_span_a': float(latest_row['senkou_span_a']) if pd.notna(latest_row['senkou_span_a']) else None,
-            'senkou_span_b': float(latest_row['senkou_span_b']) if pd.notna(latest_row['senkou_span_b']) else None,
-            'chikou_span': float(latest_row['chikou_span']) if pd.notna(latest_row['chikou_span']) else None,
-            'cloud_color': latest_row.get('cloud_color', 'unknown'),
-            'cloud_top': float(latest_row['cloud_top']) if pd.notna(latest_row.get('cloud_top')) else None,
-            'cloud_bottom': float(latest_row['cloud_bottom']) if pd.notna(latest_row.get('cloud_bottom')) else None,
-        }
+        values = {'close': float(latest_row['close'])}
+        for column in _REPORT_COLUMNS:
+            value = latest_row.get(column)
+            # NaN is the only value not equal to itself
+            values[column] = float(value) if value is not None and value == value else None
+        values['cloud_color'] = cloud_color(latest_row.get('cloud_bullish'))
+        return values
     
     def get_strategy_info(self) -> Dict:
         """Get information about the current strategy being used."""
@@ -267,10 +464,10 @@ class SignalDetector:
             'short_entry_conditions': [cond.value for cond in self.strategy_rules.short_entry],
             'long_exit_conditions': [cond.value for cond in self.strategy_rules.long_exit],
             'short_exit_conditions': [cond.value for cond in self.strategy_rules.short_exit],
-            'long_entry_logic': self.strategy_rules.long_entry_logic,
-            'short_entry_logic': self.strategy_rules.short_entry_logic,
-            'long_exit_logic': self.strategy_rules.long_exit_logic,
-            'short_exit_logic': self.strategy_rules.short_exit_logic,
+            'long_entry_logic': self.strategy_rules.long_entry_logic.name,
+            'short_entry_logic': self.strategy_rules.short_entry_logic.name,
+            'long_exit_logic': self.strategy_rules.long_exit_logic.name,
+            'short_exit_logic': self.strategy_rules.short_exit_logic.name,
             'ichimoku_parameters': {
                 'tenkan_period': self.parameters.tenkan_period,
                 'kijun_period': self.parameters.kijun_period,
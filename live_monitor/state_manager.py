@@ -5,15 +5,63 @@ Tracks signal states for each symbol to avoid duplicate notifications.
 Persists state to disk for Docker container restarts.
 """
 
+import functools
 import json
+import os
+import threading
+import time
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Optional
-from datetime import datetime
+from typing import Dict, Optional, Union
+from datetime import datetime, timezone
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+class SignalKind(IntEnum):
+    """Signal types as small ints for in-memory comparisons (labels are what gets stored)."""
+    NONE = 0
+    LONG = 1
+    SHORT = 2
+    EXIT_LONG = 3
+    EXIT_SHORT = 4
+    
+    @property
+    def label(self) -> str:
+        """Signal type string as used in notifications and the state file."""
+        return _SIGNAL_LABELS[self]
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'SignalKind':
+        """Look up the kind for a signal type string (e.g., 'EXIT LONG')."""
+        try:
+            return _KIND_BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"Unknown signal type: {label}") from None
+
+
+def _synchronized(method):
+    """Run a StateManager method under the instance lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+_SIGNAL_LABELS = ('NONE', 'LONG', 'SHORT', 'EXIT LONG', 'EXIT SHORT')
+_KIND_BY_LABEL = {label: SignalKind(i) for i, label in enumerate(_SIGNAL_LABELS)}
+
+
 class StateManager:
     """
     Manages signal states for each trading pair.
@@ -29,16 +77,20 @@ class StateManager:
     EXIT signals are always sent regardless of whether you took the trade.
     You decide manually whether to trade based on the signals.
     
-    Persists state to JSON file to survive restarts.
+    Persists state to survive restarts: each update appends one line to a
+    journal (<state file stem>.journal.jsonl) next to the state file, and
+    flush() rewrites the combined state file as a snapshot and truncates the
+    journal. On load the snapshot is read first and the journal replayed on top.
     """
     
-    def __init__(self, state_file_path: Optional[str] = None):
+    def __init__(self, state_file_path: Optional[str] = None, pretty: bool = True):
         """
         Initialize state manager.
         
         Args:
             state_file_path: Path to state JSON file
                            If None, uses data/state/signal_states.json
+            pretty: Indent the state file for readability (compact when False)
         """
         if state_file_path is None:
             state_dir = Path(__file__).parent.parent / 'data' / 'state'
@@ -46,33 +98,142 @@ class StateManager:
             state_file_path = state_dir / 'signal_states.json'
         
         self.state_file = Path(state_file_path)
+        # Symbols may be processed from several threads
+        self._lock = threading.RLock()
+        self.journal_file = self.state_file.with_suffix('.journal.jsonl')
+        self._journal = None
+        self.pretty = pretty
         self.states = self._load_states()
+        # Signal kind per symbol, mirrored from states for cheap int comparisons
+        self._kinds: Dict[str, SignalKind] = {}
+        for symbol, state in list(self.states.items()):
+            try:
+                self._kinds[symbol] = SignalKind.from_label(state.get('signal_type', 'NONE'))
+            except ValueError as e:
+                logger.warning(f"Dropping stored state for {symbol}: {e}")
+                del self.states[symbol]
+        # Set when the snapshot is behind (states changed or journal left over); cleared by flush()
+        self._dirty = self.journal_file.exists()
         
         logger.info(f"Initialized StateManager with state file: {self.state_file}")
     
     def _load_states(self) -> Dict:
-        """Load states from JSON file."""
+        """Load the state snapshot, then replay the (newer) journal entries."""
+        states = {}
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
                     states = json.load(f)
-                logger.info(f"Loaded states for {len(states)} symbols")
-                return states
             except Exception as e:
                 logger.error(f"Error loading states: {e}")
-                return {}
+                states = {}
+        
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # Partial last line from an interrupted write
+                            logger.warning(f"Skipping unreadable journal entry in {self.journal_file}")
+                            continue
+                        if entry.get('state') is None:
+                            states.pop(entry.get('symbol'), None)
+                        else:
+                            states[entry['symbol']] = entry['state']
+            except Exception as e:
+                logger.error(f"Error loading state journal: {e}")
+        
+        if states:
+            logger.info(f"Loaded states for {len(states)} symbols")
         else:
             logger.info("No existing state file found, starting fresh")
-            return {}
+        return states
+    
+    def _write_json(self, path: Path, obj: Dict):
+        """
+        Serialize obj to path atomically.
+        
+        Writes to a temporary file and renames it over the target, so a
+        restart mid-write never leaves a truncated state file behind.
+        """
+        if _HAS_ORJSON:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if self.pretty:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(obj, default=str, option=option)
+        else:
+            payload = json.dumps(obj, indent=2 if self.pretty else None, default=str).encode('utf-8')
+        tmp_file = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, path)
+    
+    def _append_journal(self, symbol: str, state: Optional[Dict]):
+        """Append one symbol's new state (None when cleared) to the journal."""
+        if state is not None:
+            self._format_timestamp(state)
+        entry = {'symbol': symbol, 'state': state}
+        if _HAS_ORJSON:
+            line = orjson.dumps(entry, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(entry, default=str) + '\n').encode('utf-8')
+        try:
+            if self._journal is None:
+                self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_file, 'ab', buffering=64 * 1024)
+                if self._journal.tell() > 0:
+                    # Terminate a partial line left by an interrupted write
+                    with open(self.journal_file, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            self._journal.write(b'\n')
+            self._journal.write(line)
+            # Hand the line to the OS so a crashed process doesn't lose it
+            self._journal.flush()
+            logger.debug(f"Journaled state for {symbol}")
+        except Exception as e:
+            logger.error(f"Error saving state for {symbol}: {e}")
+    
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
     
     def _save_states(self):
-        """Save states to JSON file."""
+        """Compact: save the combined snapshot if states changed, then empty the journal."""
+        if not self._dirty:
+            return
+        for state in self.states.values():
+            self._format_timestamp(state)
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.states, f, indent=2, default=str)
+            self._write_json(self.state_file, self.states)
+            self._dirty = False
             logger.debug(f"Saved states to {self.state_file}")
         except Exception as e:
             logger.error(f"Error saving states: {e}")
+            return
+        # Everything journaled so far is in the snapshot now
+        self._close_journal()
+        try:
+            self.journal_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Error truncating state journal: {e}")
+    
+    @_synchronized
+    def flush(self):
+        """Write the combined state snapshot and truncate the journal (no-op if nothing changed)."""
+        self._save_states()
+    
+    @staticmethod
+    def _format_timestamp(state: Dict):
+        """Convert a time.time_ns() timestamp recorded by update_state to an ISO string."""
+        ts = state.get('timestamp')
+        if isinstance(ts, int):
+            state['timestamp'] = datetime.fromtimestamp(
+                ts / 1e9, tz=timezone.utc
+            ).replace(tzinfo=None).isoformat()
     
     def get_state(self, symbol: str) -> Optional[Dict]:
         """
@@ -86,11 +247,12 @@ class StateManager:
         """
         return self.states.get(symbol)
     
+    @_synchronized
     def update_state(self, 
                     symbol: str, 
                     signal_type: str, 
                     confidence: float = 1.0,
-                    timestamp: Optional[str] = None,
+                    timestamp: Optional[Union[str, int]] = None,
                     details: Optional[Dict] = None):
         """
         Update state for a symbol.
@@ -99,17 +261,19 @@ class StateManager:
             symbol: Trading pair (e.g., 'BTC/USDT')
             signal_type: Signal type (LONG, SHORT, EXIT LONG, EXIT SHORT, NONE)
             confidence: Signal confidence (0.0 to 1.0)
-            timestamp: ISO timestamp of signal (defaults to now)
+            timestamp: ISO timestamp of signal (defaults to now; formatted on save)
             details: Additional details about the signal
         """
         if timestamp is None:
-            timestamp = datetime.utcnow().isoformat()
+            timestamp = time.time_ns()
+        
+        kind = SignalKind.from_label(signal_type)
         
         # Get current state
         current = self.states.get(symbol)
         
         # Check if signal changed
-        if current and current.get('signal_type') == signal_type:
+        if current and self._kinds.get(symbol) == kind:
             logger.debug(f"State unchanged for {symbol}: {signal_type}, not updating timestamp")
             return
         
@@ -125,10 +289,14 @@ class StateManager:
             'transition_count': transition_count,
             'details': details or {}
         }
+        self._kinds[symbol] = kind
         
-        self._save_states()
+        # Only a journal line is written; the snapshot catches up on flush()
+        self._dirty = True
+        self._append_journal(symbol, self.states[symbol])
         logger.info(f"Updated state for {symbol}: {previous_signal} → {signal_type} (confidence: {confidence:.2%})")
     
+    @_synchronized
     def has_signal_changed(self, symbol: str, new_signal_type: str) -> bool:
         """
         Check if signal has changed for a symbol.
@@ -140,12 +308,13 @@ class StateManager:
         Returns:
             True if signal has changed, False otherwise
         """
-        current_state = self.get_state(symbol)
+        new_kind = SignalKind.from_label(new_signal_type)
+        previous_kind = self._kinds.get(symbol)
         
         # If no previous state, this is a new signal
-        if current_state is None:
+        if previous_kind is None:
             # Only report actionable signals on first run
-            if new_signal_type != "NONE":
+            if new_kind != SignalKind.NONE:
                 logger.info(f"New symbol {symbol}, signal: {new_signal_type}")
                 return True
             else:
@@ -153,11 +322,10 @@ class StateManager:
                 return False
         
         # Check if signal type has changed
-        previous_signal = current_state.get('signal_type', 'NONE')
-        
-        if previous_signal != new_signal_type:
+        if previous_kind != new_kind:
+            previous_signal = previous_kind.label
             # Signal has changed
-            if new_signal_type != "NONE":
+            if new_kind != SignalKind.NONE:
                 logger.info(f"Signal changed for {symbol}: {previous_signal} -> {new_signal_type}")
                 return True
             else:
@@ -170,6 +338,7 @@ class StateManager:
             logger.debug(f"Signal unchanged for {symbol}: {new_signal_type}")
             return False
     
+    @_synchronized
     def clear_state(self, symbol: str):
         """
         Clear state for a symbol.
@@ -179,19 +348,32 @@ class StateManager:
         """
         if symbol in self.states:
             del self.states[symbol]
-            self._save_states()
+            self._kinds.pop(symbol, None)
+            self._dirty = True
+            self._append_journal(symbol, None)
             logger.info(f"Cleared state for {symbol}")
     
+    @_synchronized
     def clear_all_states(self):
         """Clear all states."""
-        self.states = {}
-        self._save_states()
+        if self.states:
+            self.states = {}
+            self._kinds = {}
+            self._dirty = True
+            self._save_states()
         logger.info("Cleared all states")
     
+    @_synchronized
     def get_all_states(self) -> Dict:
         """Get all current states."""
         return self.states.copy()
     
+    def _kind_counts(self) -> np.ndarray:
+        """Number of symbols per SignalKind, indexed by kind value."""
+        kinds = np.fromiter(self._kinds.values(), dtype=np.int8, count=len(self._kinds))
+        return np.bincount(kinds, minlength=len(SignalKind))
+    
+    @_synchronized
     def get_symbols_with_active_signals(self) -> Dict[str, str]:
         """
         Get symbols with active signals (not NONE).
@@ -199,36 +381,24 @@ class StateManager:
         Returns:
             Dictionary mapping symbol to signal type
         """
-        active = {}
-        for symbol, state in self.states.items():
-            signal_type = state.get('signal_type', 'NONE')
-            if signal_type != 'NONE':
-                active[symbol] = signal_type
-        return active
+        return {
+            symbol: kind.label for symbol, kind in self._kinds.items() if kind != SignalKind.NONE
+        }
     
+    @_synchronized
     def get_summary(self) -> Dict:
         """Get summary of all states."""
-        summary = {
+        counts = self._kind_counts().tolist()
+        summary_order = (
+            SignalKind.LONG, SignalKind.SHORT, SignalKind.EXIT_LONG, SignalKind.EXIT_SHORT, SignalKind.NONE
+        )
+        
+        return {
             'total_symbols': len(self.states),
-            'active_signals': 0,
-            'signals_by_type': {
-                'LONG': 0,
-                'SHORT': 0,
-                'EXIT LONG': 0,
-                'EXIT SHORT': 0,
-                'NONE': 0
-            },
-            'total_transitions': 0
+            'active_signals': len(self.states) - counts[SignalKind.NONE],
+            'signals_by_type': {kind.label: counts[kind] for kind in summary_order},
+            'total_transitions': sum(state.get('transition_count', 0) for state in self.states.values())
         }
-        
-        for state in self.states.values():
-            signal_type = state.get('signal_type', 'NONE')
-            summary['signals_by_type'][signal_type] = summary['signals_by_type'].get(signal_type, 0) + 1
-            summary['total_transitions'] += state.get('transition_count', 0)
-            if signal_type != 'NONE':
-                summary['active_signals'] += 1
-        
-        return summary
     
     def get_signal_context(self, symbol: str) -> Optional[Dict]:
         """
@@ -0,0 +1,169 @@
+"""
+WebSocket Kline Feed for Live Monitoring
+
+Keeps per-symbol candles up to date from the exchange's kline stream
+(ccxt.pro watch_ohlcv) so monitor cycles can read them without REST calls.
+Runs its own asyncio loop in a background thread.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+import logging
+
+import ccxt.pro as ccxt_pro
+
+logger = logging.getLogger(__name__)
+
+
+class KlineStreamFeed:
+    """
+    Streams OHLCV candles for a set of symbols into an in-memory window.
+
+    A symbol is served from memory only after it has been seeded with a REST
+    snapshot and while the stream is fresh. After a disconnect the symbol is
+    un-seeded, so the next fetch falls back to REST and re-seeds the window.
+    """
+
+    def __init__(self,
+                 exchange_name: str,
+                 exchange_config: dict,
+                 timeframe: str,
+                 max_rows: int = 500,
+                 staleness_seconds: float = 120.0):
+        """
+        Initialize kline feed.
+
+        Args:
+            exchange_name: ccxt exchange id (e.g., 'binance')
+            exchange_config: ccxt client options
+            timeframe: Candle timeframe to stream (e.g., '4h')
+            max_rows: Candles kept per symbol
+            staleness_seconds: Max age of the last stream update before falling back to REST
+        """
+        self.exchange_name = exchange_name
+        self.exchange_config = exchange_config
+        self.timeframe = timeframe
+        self.max_rows = max_rows
+        self.staleness_seconds = staleness_seconds
+
+        self._rows: dict[str, dict[int, list]] = {}
+        self._seeded: set[str] = set()
+        self._updated: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+
+    def start(self, symbols: list[str]):
+        """Start streaming the given symbols in a background thread."""
+        if self._running:
+            return
+        self._running = True
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(list(symbols),), name='kline-feed', daemon=True
+        )
+        self._thread.start()
+        logger.info("Started %s kline stream for %s", self.timeframe, ', '.join(symbols))
+
+    def stop(self, timeout: float = 10.0):
+        """Stop streaming and wait for the background thread to exit."""
+        if not self._running:
+            return
+        self._running = False
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._cancel_watchers)
+            except RuntimeError:
+                # Loop already closed (stream loop exited on its own)
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+        logger.info("Stopped kline stream")
+
+    def seed(self, symbol: str, ohlcv: list):
+        """Load a REST snapshot for a symbol; later streamed candles are merged on top."""
+        with self._lock:
+            rows = self._rows.setdefault(symbol, {})
+            # REST rows win: a bar cached from before a disconnect may be a stale partial
+            for candle in ohlcv:
+                rows[int(candle[0])] = list(candle)
+            self._trim(rows)
+            self._seeded.add(symbol)
+            self._updated.setdefault(symbol, time.monotonic())
+
+    def snapshot(self, symbol: str, limit: int) -> Optional[list]:
+        """
+        Get the latest candles for a symbol from memory.
+
+        Returns:
+            Up to limit [timestamp, open, high, low, close, volume] rows,
+            or None if the symbol is not seeded or the stream is stale
+        """
+        with self._lock:
+            if symbol not in self._seeded:
+                return None
+            if time.monotonic() - self._updated.get(symbol, 0.0) > self.staleness_seconds:
+                return None
+            rows = self._rows.get(symbol, {})
+            if len(rows) < limit:
+                return None
+            return [rows[ts] for ts in sorted(rows)[-limit:]]
+
+    def _trim(self, rows: dict[int, list]):
+        """Drop the oldest candles beyond max_rows (caller holds the lock)."""
+        excess = len(rows) - self.max_rows
+        if excess > 0:
+            for ts in sorted(rows)[:excess]:
+                del rows[ts]
+
+    def _cancel_watchers(self):
+        """Cancel the per-symbol watch tasks (runs inside the feed's loop)."""
+        for task in self._tasks:
+            task.cancel()
+
+    def _run_loop(self, symbols: list[str]):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._stream_all(symbols))
+        except Exception as e:
+            logger.error("Kline stream loop stopped: %s", e)
+        finally:
+            self._loop.close()
+
+    async def _stream_all(self, symbols: list[str]):
+        exchange = getattr(ccxt_pro, self.exchange_name)(self.exchange_config)
+        self._tasks = [asyncio.create_task(self._watch(exchange, s)) for s in symbols]
+        try:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            await exchange.close()
+
+    async def _watch(self, exchange, symbol: str):
+        """Merge streamed candles for one symbol until stopped, reconnecting on errors."""
+        delay = 1.0
+        while self._running:
+            try:
+                candles = await exchange.watch_ohlcv(symbol, self.timeframe)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Candles may have been missed; force a REST re-seed on the next fetch
+                with self._lock:
+                    self._seeded.discard(symbol)
+                logger.warning("Kline stream error for %s: %s. Reconnecting in %.0fs", symbol, e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+                continue
+
+            delay = 1.0
+            with self._lock:
+                rows = self._rows.setdefault(symbol, {})
+                for candle in candles:
+                    rows[int(candle[0])] = list(candle)
+                self._trim(rows)
+                self._updated[symbol] = time.monotonic()
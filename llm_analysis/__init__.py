@@ -1,6 +1,15 @@
 # LLM Analysis package init
+#
+# LLMClient is imported on first access (PEP 562) so importing the config
+# helpers doesn't load the client module.
 
 from .env_loader import load_llm_config, LLMConfig
-from .llm_client import LLMClient
 
 __all__ = ['LLMConfig', 'LLMClient', 'load_llm_config']
+
+
+def __getattr__(name):
+    if name == 'LLMClient':
+        from .llm_client import LLMClient
+        return LLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
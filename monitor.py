@@ -7,15 +7,114 @@ Detects Ichimoku signals and sends notifications via Discord/Telegram.
 
 import os
 import sys
+import atexit
 import yaml
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-from live_monitor import MarketDataFetcher, SignalDetector, StateManager
-from live_monitor.scheduler import MonitorScheduler
-from notifications import DiscordNotifier, TelegramNotifier, MessageFormatter
+from notifications import MessageFormatter
+
+if TYPE_CHECKING:
+    import numpy as np
+    from live_monitor import SignalDetector
+
+try:
+    # LibYAML's C parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Per-process SignalDetector for the analysis pool (set by _init_analysis_worker)
+_worker_detector: Optional['SignalDetector'] = None
+
+
+def _init_analysis_worker(detector: 'SignalDetector'):
+    """Process pool initializer: ship the detector once per worker, not once per task."""
+    global _worker_detector
+    _worker_detector = detector
+
+
+def _detect_signal_worker(symbol: str, index: 'np.ndarray', hlc: 'np.ndarray'):
+    """Rebuild the high/low/close frame from raw arrays and run signal detection."""
+    import pandas as pd
+    
+    data = pd.DataFrame(hlc, index=pd.DatetimeIndex(index), columns=['high', 'low', 'close'], copy=False)
+    return _worker_detector.detect_signal(data, symbol)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers writes instead of flushing every record.
+    
+    Records accumulate in a block-buffered file and are flushed when the buffer
+    fills, every flush_interval seconds, on rollover and on close (logging's
+    own shutdown hook closes handlers at exit).
+    """
+    
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, errors=None, buffer_size: int = 64 * 1024,
+                 flush_interval: float = 5.0):
+        self.buffer_size = buffer_size
+        # Bytes written to the current file (characters for non-ASCII text), so
+        # rollover needs no seek/tell per record
+        self._approx_bytes = 0
+        self._rotatable = True
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+        if flush_interval > 0:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically, args=(flush_interval,),
+                name='log-flush', daemon=True
+            )
+            self._flush_thread.start()
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, encoding=self.encoding,
+                      errors=self.errors, buffering=self.buffer_size)
+        # See bpo-45401: never rollover anything other than regular files
+        self._rotatable = os.path.isfile(self.baseFilename)
+        self._approx_bytes = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def _would_overflow(self, size: int) -> bool:
+        return (self.maxBytes > 0 and self._rotatable
+                and self._approx_bytes > 0 and self._approx_bytes + size >= self.maxBytes)
+    
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(len(self.format(record)) + len(self.terminator))
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            if self._would_overflow(len(msg)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._approx_bytes += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self, interval: float):
+        while not self._flush_stop.wait(interval):
+            self.flush()
+    
+    def close(self):
+        self._flush_stop.set()
+        super().close()
 
 
 class CryptoMonitor:
@@ -42,12 +141,23 @@ class CryptoMonitor:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     
     def _setup_logging(self):
-        """Setup logging configuration."""
+        """
+        Setup logging configuration.
+        
+        Records are queued by the calling thread and written to the console/file
+        by a background QueueListener, so analysis threads never block on log I/O.
+        """
         log_config = self.config.get('logging', {})
         log_level = getattr(logging, log_config.get('level', 'INFO'))
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        
+        # Setup console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        handlers = [console_handler]
         
         # Create logs directory
         log_file_config = log_config.get('file', {})
@@ -56,45 +166,77 @@ class CryptoMonitor:
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Setup file handler with rotation
-            from logging.handlers import RotatingFileHandler
-            file_handler = RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 log_path,
                 maxBytes=log_file_config.get('max_size_mb', 10) * 1024 * 1024,
-                backupCount=log_file_config.get('backup_count', 5)
+                backupCount=log_file_config.get('backup_count', 5),
+                buffer_size=log_file_config.get('buffer_kb', 64) * 1024,
+                flush_interval=log_file_config.get('flush_interval_seconds', 5)
             )
             file_handler.setLevel(log_level)
-            
-            # Setup console handler
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(log_level)
-            
-            # Configure logging
-            logging.basicConfig(
-                level=log_level,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                handlers=[file_handler, console_handler]
-            )
-        else:
-            logging.basicConfig(
-                level=log_level,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
+            handlers.insert(0, file_handler)
+        
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Configure logging (no-op if the root logger is already configured)
+        root = logging.getLogger()
+        self._log_listener: Optional[QueueListener] = None
+        if root.handlers:
+            return
+        log_queue = queue.SimpleQueue()
+        root.setLevel(log_level)
+        root.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+        # Flush whatever is still queued when the process exits
+        atexit.register(self._stop_log_listener)
+    
+    def _stop_log_listener(self):
+        """Drain queued log records and stop the background writer."""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
     
     def _initialize_components(self):
         """Initialize all monitoring components."""
+        # Imported here so 'import monitor' doesn't load ccxt/pandas
+        from live_monitor import MarketDataFetcher, SignalDetector, StateManager
+        
         # Market data fetcher with retry settings from config
         err_cfg = self.config.get('error_handling', {})
+        cache_cfg = self.config.get('data_cache', {})
         self.data_fetcher = MarketDataFetcher(
             max_retries=err_cfg.get('max_retries', 0),
-            retry_delay_seconds=err_cfg.get('retry_delay_seconds', 5)
+            retry_delay_seconds=err_cfg.get('retry_delay_seconds', 5),
+            cache_dir=cache_cfg.get('path', 'data/cache/ohlcv') if cache_cfg.get('enabled', False) else None,
+            # Frames are consumed within one cycle, so per-symbol buffers can be reused
+            reuse_buffers=True
         )
         
+        # Optional WebSocket kline stream so cycles read candles from memory
+        monitoring_config = self.config.get('monitoring', {})
+        if monitoring_config.get('streaming', False):
+            self.data_fetcher.start_streaming(
+                monitoring_config.get('symbols', ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']),
+                timeframe=monitoring_config.get('timeframe', '4h'),
+                max_rows=max(500, monitoring_config.get('data_points', 300))
+            )
+        
         # Signal detector
-        self.signal_detector = SignalDetector()
+        self.signal_detector = SignalDetector.shared()
+        
+        # Optional process pool for per-symbol signal detection (created lazily)
+        self._parallel_analysis = self.config.get('monitoring', {}).get('parallel_analysis', False)
+        self._analysis_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Threads for per-symbol network work (fetching, LLM analysis, notifications)
+        self._io_workers = self.config.get('monitoring', {}).get('io_workers', 8)
         
         # State manager
-        state_path = self.config.get('state', {}).get('file_path', 'data/state/signal_states.json')
-        self.state_manager = StateManager(state_path)
+        state_config = self.config.get('state', {})
+        state_path = state_config.get('file_path', 'data/state/signal_states.json')
+        self.state_manager = StateManager(state_path, pretty=state_config.get('pretty', True))
         
         # Message formatter
         llm_config = self.config.get('llm', {})
@@ -102,7 +244,9 @@ class CryptoMonitor:
         llm_enabled = llm_config.get('enabled', True)
         self.message_formatter = MessageFormatter(
             llm_provider=llm_provider,
-            enable_llm=llm_enabled
+            enable_llm=llm_enabled,
+            cache_size=llm_config.get('cache_size', 256),
+            cache_ttl_seconds=llm_config.get('cache_ttl_minutes', 240) * 60
         )
         
         # Initialize notifiers
@@ -118,6 +262,7 @@ class CryptoMonitor:
         if notification_config.get('discord', {}).get('enabled', False):
             webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
             if webhook_url:
+                from notifications import DiscordNotifier
                 discord = DiscordNotifier(webhook_url)
                 self.notifiers.append(('Discord', discord))
                 self.logger.info("Discord notifier enabled")
@@ -125,11 +270,20 @@ class CryptoMonitor:
                 self.logger.warning("Discord enabled but DISCORD_WEBHOOK_URL not found in .env")
         
         # Telegram
-        if notification_config.get('telegram', {}).get('enabled', False):
+        telegram_config = notification_config.get('telegram', {})
+        if telegram_config.get('enabled', False):
             bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
             chat_id = os.getenv('TELEGRAM_CHAT_ID')
+            if bot_token:
+                from notifications import TelegramNotifier
+                # Fall back to a chat ID found earlier by get_telegram_chat_id.py
+                chat_id = chat_id or TelegramNotifier.cached_chat_id(bot_token)
             if bot_token and chat_id:
-                telegram = TelegramNotifier(bot_token, chat_id)
+                telegram = TelegramNotifier(
+                    bot_token, chat_id,
+                    connection_pool_size=telegram_config.get('connection_pool_size', 32),
+                    messages_per_second=telegram_config.get('messages_per_second', 1.0)
+                )
                 self.notifiers.append(('Telegram', telegram))
                 self.logger.info("Telegram notifier enabled")
             else:
@@ -138,6 +292,10 @@ class CryptoMonitor:
         if not self.notifiers:
             self.logger.warning("No notifiers enabled! Signals will be logged but not sent.")
         
+        # Channels are sent to concurrently; the pool is created on first use and reused
+        self._notify_pool: Optional[ThreadPoolExecutor] = None
+        self._notify_timeout = notification_config.get('send_timeout_seconds', 30)
+        
         # Send test messages if configured
         if notification_config.get('test_on_startup', False):
             self._send_test_notifications()
@@ -161,97 +319,248 @@ class CryptoMonitor:
         
         self.logger.info(f"Starting analysis cycle at {datetime.now(UTC).isoformat()}")
         
-        for symbol in symbols:
+        # 1. Fetch market data for all symbols in one batched call
+        market_data = {}
+        fetched = self.data_fetcher.fetch_latest_data_batch(
+            symbols, timeframe=timeframe, limit=data_points, max_workers=self._io_workers
+        )
+        for symbol, data in fetched.items():
+            if isinstance(data, Exception):
+                self._handle_symbol_error(symbol, data)
+                continue
+            if data.empty:
+                self.logger.warning(f"No data received for {symbol}, skipping")
+                continue
+            market_data[symbol] = data
+        
+        # 2. Detect signals
+        signal_results = self._detect_signals(market_data)
+        
+        # 3-4. Check for changes and format messages on a thread pool; LLM calls overlap across symbols
+        formatted_signals = self._run_per_symbol(
+            self._process_signal, {symbol: (result,) for symbol, result in signal_results.items()}
+        )
+        pending_signals = [formatted for formatted in formatted_signals.values() if formatted is not None]
+        
+        # 5. Send all new signals together (channels that support it get one message per batch)
+        self._send_notifications(pending_signals)
+        
+        # 6. Update state to the new signals
+        for formatted in pending_signals:
+            self.state_manager.update_state(
+                symbol=formatted['symbol'],
+                signal_type=formatted['signal_type'],
+                confidence=formatted['confidence'],
+                timestamp=formatted['timestamp'].isoformat()
+            )
+        
+        # Refresh the combined state snapshot once per cycle
+        self.state_manager.flush()
+        
+        self.logger.info("Analysis cycle completed")
+        self.logger.info("-" * 70)
+    
+    def _run_per_symbol(self, func: Callable, jobs: Dict[str, tuple]) -> Dict:
+        """
+        Run func(symbol, *args) for every symbol, concurrently on a thread pool.
+        
+        Failures go through _handle_symbol_error and are left out of the result.
+        
+        Args:
+            func: Per-symbol callable
+            jobs: Dictionary mapping symbol to the extra positional arguments
+        
+        Returns:
+            Dictionary mapping symbol to func's return value, in jobs order
+        """
+        results = {}
+        if len(jobs) <= 1 or self._io_workers <= 1:
+            for symbol, args in jobs.items():
+                try:
+                    results[symbol] = func(symbol, *args)
+                except Exception as e:
+                    self._handle_symbol_error(symbol, e)
+            return results
+        
+        workers = min(len(jobs), self._io_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='symbol') as pool:
+            futures = {pool.submit(func, symbol, *args): symbol for symbol, args in jobs.items()}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    self._handle_symbol_error(symbol, e)
+        
+        return {symbol: results[symbol] for symbol in jobs if symbol in results}
+    
+    def _detect_signals(self, market_data: Dict) -> Dict:
+        """
+        Run signal detection for every fetched symbol.
+        
+        By default all symbols are analyzed in one batched indicator pass. With
+        monitoring.parallel_analysis enabled, symbols are farmed out to a process
+        pool so the CPU-bound Ichimoku calculations run on separate cores.
+        
+        Returns:
+            Dictionary mapping symbol to SignalResult (failed symbols are omitted)
+        """
+        results = {}
+        
+        if not self._parallel_analysis or len(market_data) < 2:
             try:
-                self.logger.info(f"Analyzing {symbol}...")
-                
-                # 1. Fetch market data
-                data = self.data_fetcher.fetch_latest_data(
+                return self.signal_detector.detect_signals_batch(market_data)
+            except Exception as e:
+                # Retry one symbol at a time so one bad frame doesn't sink the rest
+                self.logger.warning(f"Batch signal detection failed ({e}), analyzing symbols individually")
+            for symbol, data in market_data.items():
+                try:
+                    results[symbol] = self.signal_detector.detect_signal(data, symbol)
+                except Exception as e:
+                    self._handle_symbol_error(symbol, e)
+            return results
+        
+        if self._analysis_pool is None:
+            workers = min(len(market_data), os.cpu_count() or 1)
+            self._analysis_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_analysis_worker,
+                initargs=(self.signal_detector,)
+            )
+            self.logger.info(f"Started analysis process pool with {workers} workers")
+        
+        # Workers keep their own caches and may not see a symbol twice, so closed
+        # bars already analyzed (retries, restarts of a cycle) are answered here
+        futures = {}
+        for symbol, data in market_data.items():
+            cached = self.signal_detector.cached_signal(data, symbol)
+            if cached is not None:
+                results[symbol] = cached
+                continue
+            # Only raw high/low/close arrays cross the process boundary (no DataFrame pickling);
+            # workers send back the compact SignalResult rather than any frames
+            futures[symbol] = self._analysis_pool.submit(
+                _detect_signal_worker,
+                symbol,
+                data.index.to_numpy(),
+                data[['high', 'low', 'close']].to_numpy()
+            )
+        for symbol, future in futures.items():
+            try:
+                results[symbol] = future.result()
+                self.signal_detector.remember_signal(market_data[symbol], symbol, results[symbol])
+            except Exception as e:
+                self._handle_symbol_error(symbol, e)
+        
+        # Keep the configured symbol order
+        return {symbol: results[symbol] for symbol in market_data if symbol in results}
+    
+    def _process_signal(self, symbol: str, signal_result) -> Optional[Dict]:
+        """
+        Check one symbol's signal for a change and format the notification.
+        
+        Returns:
+            Formatted signal to send, or None if the signal hasn't changed
+        """
+        # 3. Check if signal changed (we only notify on changes)
+        changed = self.state_manager.has_signal_changed(symbol, signal_result.signal_type)
+        if changed:
+            self.logger.info(
+                f"New signal for {symbol}: {signal_result.signal_type} "
+                f"(confidence: {signal_result.confidence:.1%})"
+            )
+            
+            # 4. Format message with LLM analysis
+            return self.message_formatter.format_signal(
+                symbol=symbol,
+                signal_type=signal_result.signal_type,
+                confidence=signal_result.confidence,
+                ichimoku_values=signal_result.ichimoku_values,
+                timestamp=signal_result.timestamp
+            )
+        else:
+            # Persist return-to-NONE transitions even without notifying
+            if signal_result.signal_type == 'NONE':
+                self.state_manager.update_state(
                     symbol=symbol,
-                    timeframe=timeframe,
-                    limit=data_points
+                    signal_type='NONE',
+                    confidence=0.0,
+                    timestamp=signal_result.timestamp.isoformat()
                 )
-                
-                if data.empty:
-                    self.logger.warning(f"No data received for {symbol}, skipping")
-                    continue
-                
-                # 2. Detect signal
-                signal_result = self.signal_detector.detect_signal(data, symbol)
-                
-                # 3. Check if signal changed (we only notify on changes)
-                changed = self.state_manager.has_signal_changed(symbol, signal_result.signal_type)
-                if changed:
-                    self.logger.info(
-                        f"New signal for {symbol}: {signal_result.signal_type} "
-                        f"(confidence: {signal_result.confidence:.1%})"
-                    )
-                    
-                    # 4. Format message with LLM analysis
-                    formatted = self.message_formatter.format_signal(
-                        symbol=symbol,
-                        signal_type=signal_result.signal_type,
-                        confidence=signal_result.confidence,
-                        ichimoku_values=signal_result.ichimoku_values,
-                        timestamp=signal_result.timestamp
-                    )
-                    
-                    # 5. Send notifications
-                    self._send_notifications(formatted)
-                    
-                    # 6. Update state to the new signal
-                    self.state_manager.update_state(
-                        symbol=symbol,
-                        signal_type=signal_result.signal_type,
-                        confidence=signal_result.confidence,
-                        timestamp=signal_result.timestamp.isoformat()
-                    )
-                else:
-                    # Persist return-to-NONE transitions even without notifying
-                    if signal_result.signal_type == 'NONE':
-                        self.state_manager.update_state(
-                            symbol=symbol,
-                            signal_type='NONE',
-                            confidence=0.0,
-                            timestamp=signal_result.timestamp.isoformat()
-                        )
-                        self.logger.debug(f"State persisted to NONE for {symbol}")
-                    else:
-                        self.logger.debug(f"No signal change for {symbol} (still {signal_result.signal_type})")
-                
-            except Exception as e:
-                self.logger.error(f"Error analyzing {symbol}: {e}", exc_info=True)
-                
-                # Continue with other symbols if configured
-                if not self.config.get('error_handling', {}).get('continue_on_error', True):
-                    raise
+                self.logger.debug(f"State persisted to NONE for {symbol}")
+            else:
+                self.logger.debug(f"No signal change for {symbol} (still {signal_result.signal_type})")
+        return None
+    
+    def _handle_symbol_error(self, symbol: str, error: Exception):
+        """Log a per-symbol failure and re-raise unless continue_on_error is set."""
+        self.logger.error(f"Error analyzing {symbol}: {error}", exc_info=error)
         
-        self.logger.info("Analysis cycle completed")
-        self.logger.info("-" * 70)
+        # Continue with other symbols if configured
+        if not self.config.get('error_handling', {}).get('continue_on_error', True):
+            raise error
+    
+    def _shutdown_analysis_pool(self):
+        """Stop the analysis worker processes, if any were started."""
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown(wait=False, cancel_futures=True)
+            self._analysis_pool = None
     
-    def _send_notifications(self, formatted: Dict):
-        """Send notifications via all enabled channels."""
+    def _send_notifications(self, signals: List[Dict]):
+        """
+        Send formatted signals via all enabled channels concurrently.
+        
+        Notifiers with send_signals_batch (Discord) get every signal in one call;
+        the others get one send_signal call per signal.
+        """
+        if not self.notifiers or not signals:
+            return
+        
+        if self._notify_pool is None:
+            self._notify_pool = ThreadPoolExecutor(
+                max_workers=len(self.notifiers) * max(1, self._io_workers),
+                thread_name_prefix='notify'
+            )
+        
+        futures = []
         for name, notifier in self.notifiers:
-            try:
-                success = notifier.send_signal(
-                    symbol=formatted['symbol'],
-                    signal_type=formatted['signal_type'],
-                    confidence=formatted['confidence'],
-                    price=formatted['price'],
-                    stop_loss=formatted['stop_loss'],
-                    ichimoku_values=formatted['ichimoku_values'],
-                    llm_analysis=formatted.get('llm_analysis'),
-                    timestamp=formatted['timestamp']
+            send_batch = getattr(notifier, 'send_signals_batch', None)
+            if send_batch is not None and len(signals) > 1:
+                futures.append((name, signals, self._notify_pool.submit(send_batch, signals)))
+            else:
+                futures.extend(
+                    (name, [formatted], self._notify_pool.submit(notifier.send_signal, **formatted))
+                    for formatted in signals
                 )
+        
+        for name, sent, future in futures:
+            symbols = ', '.join(formatted['symbol'] for formatted in sent)
+            try:
+                success = future.result(timeout=self._notify_timeout)
+                # Batch sends report one flag per signal
+                flags = success if isinstance(success, list) else [success] * len(sent)
                 
-                if success:
-                    self.logger.info(f"✓ {name} notification sent for {formatted['symbol']}")
-                else:
-                    self.logger.warning(f"✗ {name} notification failed for {formatted['symbol']}")
+                for formatted, ok in zip(sent, flags):
+                    if ok:
+                        self.logger.info(f"✓ {name} notification sent for {formatted['symbol']}")
+                    else:
+                        self.logger.warning(f"✗ {name} notification failed for {formatted['symbol']}")
                     
+            except FutureTimeout:
+                self.logger.error(f"{name} notification for {symbols} timed out after {self._notify_timeout}s")
             except Exception as e:
                 self.logger.error(f"Error sending {name} notification: {e}")
     
+    def _shutdown_notify_pool(self):
+        """Stop the notification threads, letting in-flight sends finish, and close notifiers."""
+        if self._notify_pool is not None:
+            self._notify_pool.shutdown(wait=True)
+            self._notify_pool = None
+        for _, notifier in self.notifiers:
+            close = getattr(notifier, 'close', None)
+            if close is not None:
+                close()
+    
     def start(self):
         """Start the monitoring service."""
         if not self.config.get('monitoring', {}).get('enabled', True):
@@ -270,6 +579,7 @@ class CryptoMonitor:
                 self.logger.error(f"Error in initial analysis: {e}", exc_info=True)
         
         # Setup scheduler
+        from live_monitor import MonitorScheduler
         scheduler = MonitorScheduler(self.analyze_and_notify)
         
         # Start scheduled monitoring
@@ -282,6 +592,12 @@ class CryptoMonitor:
         except Exception as e:
             self.logger.error(f"Fatal error: {e}", exc_info=True)
             raise
+        finally:
+            self._shutdown_analysis_pool()
+            self._shutdown_notify_pool()
+            self.data_fetcher.stop_streaming()
+            self.state_manager.flush()
+            self._stop_log_listener()
     
     def _show_configuration(self):
         """Display current configuration."""
@@ -3,14 +3,34 @@ Notifications Module
 
 Provides notification capabilities for trading signals via Discord and Telegram.
 Includes LLM-enhanced message formatting with Gemini and OpenAI support.
+
+Components are imported lazily on first access (PEP 562) so a disabled
+channel never pays for its HTTP client imports.
 """
 
-from .discord_notifier import DiscordNotifier
-from .telegram_notifier import TelegramNotifier
-from .message_formatter import MessageFormatter
+import importlib
+
+_LAZY = {
+    'DiscordNotifier': '.discord_notifier',
+    'TelegramNotifier': '.telegram_notifier',
+    'MessageFormatter': '.message_formatter',
+}
 
 __all__ = [
     'DiscordNotifier',
     'TelegramNotifier',
     'MessageFormatter',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,62 @@
+"""
+Shared HTTP plumbing for the notifiers
+
+JSON encoding, request defaults and the pooled aiohttp session used by the
+*_async methods of DiscordNotifier and TelegramNotifier.
+"""
+
+import json
+from typing import Dict
+
+try:
+    import aiohttp
+    _HAS_AIOHTTP = True
+except Exception:
+    _HAS_AIOHTTP = False
+
+# Caught by the async send paths; an empty tuple matches nothing when aiohttp is missing
+ClientError = aiohttp.ClientError if _HAS_AIOHTTP else ()
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+class HTTPNotifierMixin:
+    """
+    Request defaults, JSON encoding and async session handling for a notifier.
+
+    Subclasses set SERVICE_NAME and self._async_session = None in __init__.
+    """
+
+    SERVICE_NAME = 'HTTP'
+
+    # (connect, read) timeouts in seconds for requests
+    REQUEST_TIMEOUT = (3.05, 10)
+
+    JSON_HEADERS = {'Content-Type': 'application/json'}
+
+    async def start(self):
+        """Open the pooled aiohttp session used by the async methods (idempotent)."""
+        if not _HAS_AIOHTTP:
+            raise ImportError(f"aiohttp is required for async {self.SERVICE_NAME} notifications")
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+
+    async def aclose(self):
+        """Close the aiohttp session, if one was opened."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    @staticmethod
+    def _encode(payload: Dict) -> bytes:
+        """Serialize a request payload to UTF-8 JSON (orjson when available)."""
+        if _HAS_ORJSON:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
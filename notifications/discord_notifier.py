@@ -6,14 +6,18 @@ Supports rich formatting with embeds for better visualization.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
+from ._http import ClientError, HTTPNotifierMixin
+
 logger = logging.getLogger(__name__)
 
 
-class DiscordNotifier:
+class DiscordNotifier(HTTPNotifierMixin):
     """
     Sends trading signal notifications to Discord via webhook.
     
@@ -36,6 +40,12 @@ class DiscordNotifier:
         'EXIT SHORT': '✅'
     }
     
+    # Webhook message limits: embeds per message and total embed characters
+    MAX_EMBEDS_PER_MESSAGE = 10
+    MAX_EMBED_CHARS_PER_MESSAGE = 6000
+    
+    SERVICE_NAME = 'Discord'
+    
     def __init__(self, webhook_url: str):
         """
         Initialize Discord notifier.
@@ -44,6 +54,28 @@ class DiscordNotifier:
             webhook_url: Discord webhook URL
         """
         self.webhook_url = webhook_url
+        
+        # Per-signal-type (title prefix, color) so embeds only splice in the symbol
+        self._embed_styles = {
+            signal_type: (f"{self.SIGNAL_EMOJIS.get(signal_type, '📊')} {signal_type} Signal: ", color)
+            for signal_type, color in self.SIGNAL_COLORS.items()
+        }
+        
+        # Persistent session keeps the TLS connection to discord.com warm between signals.
+        # Only rate limits / gateway errors are retried: a 500 may already have posted.
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset({'POST'}),
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+        
+        # aiohttp session for the *_async methods (opened by start() inside the caller's loop)
+        self._async_session = None
+        
         logger.info("Initialized DiscordNotifier")
     
     def send_signal(self,
@@ -72,27 +104,13 @@ class DiscordNotifier:
             True if sent successfully, False otherwise
         """
         try:
-            if timestamp is None:
-                timestamp = datetime.utcnow()
-            
-            # Build embed
-            embed = self._build_embed(
-                symbol=symbol,
-                signal_type=signal_type,
-                confidence=confidence,
-                price=price,
-                stop_loss=stop_loss,
-                ichimoku_values=ichimoku_values,
-                llm_analysis=llm_analysis,
-                timestamp=timestamp
+            payload = self._signal_payload(
+                symbol, signal_type, confidence, price, stop_loss,
+                ichimoku_values, llm_analysis, timestamp
             )
             
             # Send to Discord
-            payload = {
-                'embeds': [embed]
-            }
-            
-            response = requests.post(self.webhook_url, json=payload)
+            response = self._post(payload)
             response.raise_for_status()
             
             logger.info(f"Sent Discord notification for {symbol} {signal_type}")
@@ -105,6 +123,135 @@ class DiscordNotifier:
             logger.error(f"Unexpected error sending Discord notification: {e}")
             return False
     
+    def send_signals_batch(self, signals: List[Dict]) -> List[bool]:
+        """
+        Send several trading signals as embeds of as few webhook messages as possible.
+        
+        Embeds are packed up to Discord's per-message limits (10 embeds, 6000
+        embed characters), so a cycle with several new signals usually costs a
+        single POST.
+        
+        Args:
+            signals: Formatted signals, each with send_signal()'s keyword arguments
+        
+        Returns:
+            Success flag per signal, aligned with signals (a failed message
+            only marks the signals it carried)
+        """
+        results = []
+        # Chunks keep the order of signals, so each maps to the next len(chunk) entries
+        for chunk in self._chunk_embeds([self._embed_for(signal) for signal in signals]):
+            try:
+                response = self._post({'embeds': chunk})
+                response.raise_for_status()
+                logger.info(f"Sent Discord notification with {len(chunk)} signal(s)")
+                sent = True
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to send Discord notification: {e}")
+                sent = False
+            except Exception as e:
+                logger.error(f"Unexpected error sending Discord notification: {e}")
+                sent = False
+            results.extend([sent] * len(chunk))
+        return results
+    
+    async def send_signal_async(self,
+                                symbol: str,
+                                signal_type: str,
+                                confidence: float,
+                                price: float,
+                                stop_loss: float,
+                                ichimoku_values: Dict,
+                                llm_analysis: Optional[str] = None,
+                                timestamp: Optional[datetime] = None) -> bool:
+        """
+        Send trading signal notification to Discord without blocking the event loop.
+        
+        Same arguments and return value as send_signal().
+        """
+        try:
+            payload = self._signal_payload(
+                symbol, signal_type, confidence, price, stop_loss,
+                ichimoku_values, llm_analysis, timestamp
+            )
+            
+            await self.start()
+            async with self._async_session.post(
+                self.webhook_url, data=self._encode(payload), headers=self.JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+            
+            logger.info(f"Sent Discord notification for {symbol} {signal_type}")
+            return True
+            
+        except ClientError as e:
+            logger.error(f"Failed to send Discord notification: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error sending Discord notification: {e}")
+            return False
+    
+    def _signal_payload(self,
+                        symbol: str,
+                        signal_type: str,
+                        confidence: float,
+                        price: float,
+                        stop_loss: float,
+                        ichimoku_values: Dict,
+                        llm_analysis: Optional[str],
+                        timestamp: Optional[datetime]) -> Dict:
+        """Build the webhook payload for a signal."""
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        
+        # Build embed
+        embed = self._build_embed(
+            symbol=symbol,
+            signal_type=signal_type,
+            confidence=confidence,
+            price=price,
+            stop_loss=stop_loss,
+            ichimoku_values=ichimoku_values,
+            llm_analysis=llm_analysis,
+            timestamp=timestamp
+        )
+        
+        return {
+            'embeds': [embed]
+        }
+    
+    def _embed_for(self, signal: Dict) -> Dict:
+        """Build the embed for one formatted signal dictionary."""
+        return self._build_embed(
+            symbol=signal['symbol'],
+            signal_type=signal['signal_type'],
+            confidence=signal['confidence'],
+            price=signal['price'],
+            stop_loss=signal['stop_loss'],
+            ichimoku_values=signal['ichimoku_values'],
+            llm_analysis=signal.get('llm_analysis'),
+            timestamp=signal.get('timestamp') or datetime.utcnow()
+        )
+    
+    def _chunk_embeds(self, embeds: List[Dict]) -> List[List[Dict]]:
+        """Group embeds into messages within Discord's count and character limits."""
+        chunks = []
+        chunk, chars = [], 0
+        for embed in embeds:
+            size = (
+                len(embed['title']) + len(embed['description']) + len(embed['footer']['text'])
+                + sum(len(field['name']) + len(field['value']) for field in embed['fields'])
+            )
+            if chunk and (len(chunk) == self.MAX_EMBEDS_PER_MESSAGE
+                          or chars + size > self.MAX_EMBED_CHARS_PER_MESSAGE):
+                chunks.append(chunk)
+                chunk, chars = [], 0
+            chunk.append(embed)
+            chars += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
     def _build_embed(self,
                     symbol: str,
                     signal_type: str,
@@ -116,11 +263,13 @@ class DiscordNotifier:
                     timestamp: datetime) -> Dict:
         """Build Discord embed for signal notification."""
         
-        emoji = self.SIGNAL_EMOJIS.get(signal_type, '📊')
-        color = self.SIGNAL_COLORS.get(signal_type, 0x3498db)
+        style = self._embed_styles.get(signal_type)
+        if style is None:
+            style = (f"📊 {signal_type} Signal: ", 0x3498db)
+        title_prefix, color = style
         
         # Title
-        title = f"{emoji} {signal_type} Signal: {symbol}"
+        title = title_prefix + symbol
         
         # Description with price and confidence
         description = (
@@ -128,16 +277,17 @@ class DiscordNotifier:
             f"**Confidence:** {confidence:.1%}"
         )
         # Include stop loss only for entry signals
-        if signal_type in ['LONG', 'SHORT'] and isinstance(stop_loss, (int, float)):
+        if signal_type in ('LONG', 'SHORT') and isinstance(stop_loss, (int, float)):
             description += f"\n**Stop Loss (4%):** ${stop_loss:,.2f}"
         
         # Build fields for Ichimoku data
         fields = []
+        get = ichimoku_values.get
         
         # Ichimoku indicators
-        tenkan = ichimoku_values.get('tenkan_sen')
-        kijun = ichimoku_values.get('kijun_sen')
-        cloud_color = ichimoku_values.get('cloud_color', 'unknown')
+        tenkan = get('tenkan_sen')
+        kijun = get('kijun_sen')
+        cloud_color = get('cloud_color', 'unknown')
         
         if tenkan is not None and kijun is not None:
             fields.append({
@@ -151,8 +301,8 @@ class DiscordNotifier:
             })
         
         # Cloud boundaries
-        cloud_top = ichimoku_values.get('cloud_top')
-        cloud_bottom = ichimoku_values.get('cloud_bottom')
+        cloud_top = get('cloud_top')
+        cloud_bottom = get('cloud_bottom')
         
         if cloud_top is not None and cloud_bottom is not None:
             fields.append({
@@ -198,7 +348,7 @@ class DiscordNotifier:
                 'content': '✅ Discord webhook connection test successful!'
             }
             
-            response = requests.post(self.webhook_url, json=payload)
+            response = self._post(payload)
             response.raise_for_status()
             
             logger.info("Discord test message sent successfully")
@@ -207,3 +357,42 @@ class DiscordNotifier:
         except Exception as e:
             logger.error(f"Failed to send Discord test message: {e}")
             return False
+    
+    async def send_test_message_async(self) -> bool:
+        """Send a test message without blocking the event loop (see send_test_message())."""
+        try:
+            payload = {
+                'content': '✅ Discord webhook connection test successful!'
+            }
+            
+            await self.start()
+            async with self._async_session.post(
+                self.webhook_url, data=self._encode(payload), headers=self.JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+            
+            logger.info("Discord test message sent successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send Discord test message: {e}")
+            return False
+    
+    def _post(self, payload: Dict) -> requests.Response:
+        """POST a JSON payload to the webhook on the pooled session."""
+        return self.session.post(
+            self.webhook_url,
+            data=self._encode(payload),
+            headers=self.JSON_HEADERS,
+            timeout=self.REQUEST_TIMEOUT
+        )
+    
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -6,14 +6,46 @@ Calculates stop loss levels and generates actionable trading insights.
 """
 
 import logging
+import math
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 from datetime import datetime
 
-from llm_analysis.llm_client import LLMClient
-from llm_analysis.env_loader import LLMConfig
-
 logger = logging.getLogger(__name__)
 
+# Prompt text is constant; only the values change per signal
+_format_llm_prompt = """You are a crypto trading assistant. A {signal_type} signal has been detected for {symbol} on the 4-hour timeframe.
+
+Market Data:
+- Current Price: ${price:,.2f}{stop_line}
+- Tenkan-sen (Conversion Line): {tenkan}
+- Kijun-sen (Base Line): {kijun}
+- Cloud Status: {cloud_color}
+- Cloud Top: {cloud_top}
+- Cloud Bottom: {cloud_bottom}
+- Signal Confidence: {confidence:.1%}
+
+Provide a concise 2-3 sentence analysis explaining:
+1) Why this {signal_type} signal is significant based on Ichimoku indicators
+2) Key support/resistance levels to watch
+3) One brief risk consideration
+
+Keep it actionable and trader-friendly. Maximum 150 words.""".format
+
+
+def _format_price(value) -> str:
+    """Format numeric values as dollar amounts; pass placeholders through."""
+    return f"${value:,.2f}" if isinstance(value, (int, float)) else str(value)
+
+
+def _bucket(value, digits: int = 3):
+    """Round numbers to a few significant digits so near-identical inputs share a cache key."""
+    if not isinstance(value, (int, float)) or not math.isfinite(value) or value == 0:
+        return value
+    return round(value, digits - 1 - math.floor(math.log10(abs(value))))
+
 
 class MessageFormatter:
     """
@@ -23,18 +55,41 @@ class MessageFormatter:
     Calculates stop loss levels and prepares data for notifications.
     """
     
-    def __init__(self, llm_provider: str = "gemini", enable_llm: bool = True):
+    # Stop loss as a multiple of price for entry signals:
+    # 4% below for LONG positions, 4% above for SHORT
+    STOP_LOSS_MULTIPLIERS = {
+        'LONG': 0.96,
+        'SHORT': 1.04
+    }
+    
+    def __init__(self,
+                 llm_provider: str = "gemini",
+                 enable_llm: bool = True,
+                 cache_size: int = 256,
+                 cache_ttl_seconds: float = 4 * 3600):
         """
         Initialize message formatter.
         
         Args:
             llm_provider: LLM provider to use ("gemini" or "openai")
             enable_llm: Enable LLM analysis (set False to skip AI insights)
+            cache_size: Maximum LLM analyses kept for reuse (0 disables the cache)
+            cache_ttl_seconds: How long a cached analysis may be reused
         """
         self.llm_provider = llm_provider.lower()
         self.enable_llm = enable_llm
         
+        # Recent analyses keyed by provider, symbol, signal and bucketed indicator values
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         if self.enable_llm:
+            # LLM client is only imported when analysis is enabled
+            from llm_analysis.llm_client import LLMClient
+            from llm_analysis.env_loader import LLMConfig
+            
             # Load LLM configuration
             config = LLMConfig.from_env()
             self.llm_client = LLMClient(config)
@@ -109,11 +164,11 @@ class MessageFormatter:
         Returns:
             Stop loss price or None for exit signals
         """
-        if signal_type in ['LONG', 'SHORT']:
-            # For LONG positions, stop loss is 4% below; for SHORT, 4% above
-            return price * 0.96 if signal_type == 'LONG' else price * 1.04
+        multiplier = self.STOP_LOSS_MULTIPLIERS.get(signal_type)
         # Exit signals shouldn't include stop loss
-        return None
+        if multiplier is None:
+            return None
+        return price * multiplier
     
     def _generate_llm_analysis(self,
                               symbol: str,
@@ -141,6 +196,12 @@ class MessageFormatter:
         Returns:
             AI-generated analysis string or None if failed
         """
+        cache_key = self._analysis_cache_key(symbol, signal_type, price, ichimoku_values, confidence)
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached LLM analysis for {symbol} {signal_type}")
+            return cached
+        
         try:
             # Build prompt
             prompt = self._build_llm_prompt(
@@ -158,17 +219,61 @@ class MessageFormatter:
                 provider=self.llm_provider
             )
             
-            # Trim to reasonable length (Discord/Telegram limits)
+            # Trim to reasonable length (Discord/Telegram limits count characters, and
+            # str slicing never splits a code point); one ellipsis char keeps more text
             if analysis and len(analysis) > 800:
-                analysis = analysis[:797] + "..."
+                analysis = analysis[:799].rstrip() + "…"
             
             logger.info(f"Generated LLM analysis for {symbol} using {self.llm_provider}")
+            if analysis:
+                self._cache_analysis(cache_key, analysis)
             return analysis
             
         except Exception as e:
             logger.error(f"Failed to generate LLM analysis: {e}")
             return None
     
+    def _analysis_cache_key(self,
+                            symbol: str,
+                            signal_type: str,
+                            price: float,
+                            ichimoku_values: Dict,
+                            confidence: float) -> Tuple:
+        """Cache key for an analysis; prices are bucketed to 3 significant digits."""
+        return (
+            self.llm_provider,
+            symbol,
+            signal_type,
+            _bucket(price),
+            _bucket(ichimoku_values.get('tenkan_sen')),
+            _bucket(ichimoku_values.get('kijun_sen')),
+            ichimoku_values.get('cloud_color'),
+            round(confidence, 2)
+        )
+    
+    def _get_cached_analysis(self, key: Tuple) -> Optional[str]:
+        """Return a fresh cached analysis for key, or None."""
+        with self._cache_lock:
+            entry = self._analysis_cache.get(key)
+            if entry is None:
+                return None
+            created, analysis = entry
+            if time.monotonic() - created > self.cache_ttl_seconds:
+                del self._analysis_cache[key]
+                return None
+            self._analysis_cache.move_to_end(key)
+            return analysis
+    
+    def _cache_analysis(self, key: Tuple, analysis: str):
+        """Store an analysis, evicting the least recently used entries beyond cache_size."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._analysis_cache[key] = (time.monotonic(), analysis)
+            self._analysis_cache.move_to_end(key)
+            while len(self._analysis_cache) > self.cache_size:
+                self._analysis_cache.popitem(last=False)
+    
     def _build_llm_prompt(self,
                          symbol: str,
                          signal_type: str,
@@ -177,45 +282,21 @@ class MessageFormatter:
                          ichimoku_values: Dict,
                          confidence: float) -> str:
         """Build prompt for LLM analysis."""
-        
-        tenkan = ichimoku_values.get('tenkan_sen', 'N/A')
-        kijun = ichimoku_values.get('kijun_sen', 'N/A')
-        cloud_color = ichimoku_values.get('cloud_color', 'unknown')
-        cloud_top = ichimoku_values.get('cloud_top', 'N/A')
-        cloud_bottom = ichimoku_values.get('cloud_bottom', 'N/A')
-        
-        # Format values
-        if isinstance(tenkan, (int, float)):
-            tenkan = f"${tenkan:,.2f}"
-        if isinstance(kijun, (int, float)):
-            kijun = f"${kijun:,.2f}"
-        if isinstance(cloud_top, (int, float)):
-            cloud_top = f"${cloud_top:,.2f}"
-        if isinstance(cloud_bottom, (int, float)):
-            cloud_bottom = f"${cloud_bottom:,.2f}"
-        
         # Stop loss line only for entry signals
         stop_line = f"\n- Stop Loss (4%): ${stop_loss:,.2f}" if isinstance(stop_loss, (int, float)) else ""
         
-        prompt = f"""You are a crypto trading assistant. A {signal_type} signal has been detected for {symbol} on the 4-hour timeframe.
-
-Market Data:
-- Current Price: ${price:,.2f}{stop_line}
-- Tenkan-sen (Conversion Line): {tenkan}
-- Kijun-sen (Base Line): {kijun}
-- Cloud Status: {cloud_color.capitalize()}
-- Cloud Top: {cloud_top}
-- Cloud Bottom: {cloud_bottom}
-- Signal Confidence: {confidence:.1%}
-
-Provide a concise 2-3 sentence analysis explaining:
-1) Why this {signal_type} signal is significant based on Ichimoku indicators
-2) Key support/resistance levels to watch
-3) One brief risk consideration
-
-Keep it actionable and trader-friendly. Maximum 150 words."""
-        
-        return prompt
+        return _format_llm_prompt(
+            signal_type=signal_type,
+            symbol=symbol,
+            price=price,
+            stop_line=stop_line,
+            tenkan=_format_price(ichimoku_values.get('tenkan_sen', 'N/A')),
+            kijun=_format_price(ichimoku_values.get('kijun_sen', 'N/A')),
+            cloud_color=ichimoku_values.get('cloud_color', 'unknown').capitalize(),
+            cloud_top=_format_price(ichimoku_values.get('cloud_top', 'N/A')),
+            cloud_bottom=_format_price(ichimoku_values.get('cloud_bottom', 'N/A')),
+            confidence=confidence
+        )
     
     def set_llm_provider(self, provider: str):
         """
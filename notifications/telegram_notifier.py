@@ -2,22 +2,50 @@
 Telegram Notifier for Trading Signals
 
 Sends formatted trading signal notifications to Telegram via bot API.
-Supports Markdown formatting for better readability.
+Supports HTML formatting for better readability.
 """
 
+import html
+import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Optional
 from datetime import datetime
+from pathlib import Path
+
+from live_monitor.rate_limiter import TokenBucket, parse_retry_after
+from ._http import ClientError, HTTPNotifierMixin
 
 logger = logging.getLogger(__name__)
 
+# Chat IDs discovered via getUpdates, per bot
+CHAT_ID_CACHE = Path(__file__).resolve().parent.parent / 'data' / 'cache' / 'telegram_chat_ids.json'
+
+# Rule under the message header
+DIVIDER = "━" * 21
+
+
+def _bot_id(bot_token: str) -> str:
+    """Public numeric bot id (the part of the token before ':'), used as cache key."""
+    return bot_token.split(':', 1)[0]
+
+
+def _escape(text: str) -> str:
+    """Escape text for parse_mode=HTML (Telegram only needs <, > and &)."""
+    return html.escape(text, quote=False)
+
 
-class TelegramNotifier:
+class TelegramNotifier(HTTPNotifierMixin):
     """
     Sends trading signal notifications to Telegram via bot API.
     
-    Uses Telegram Bot API with Markdown formatting for structured messages.
+    Uses Telegram Bot API with HTML formatting for structured messages.
     """
     
     # Signal type to emoji mapping
@@ -28,17 +56,46 @@ class TelegramNotifier:
         'EXIT SHORT': '✅'
     }
     
-    def __init__(self, bot_token: str, chat_id: str):
+    SERVICE_NAME = 'Telegram'
+    
+    # Recently sent signals remembered for duplicate suppression
+    RECENT_SENDS = 256
+    
+    def __init__(self,
+                 bot_token: str,
+                 chat_id: str,
+                 connection_pool_size: int = 32,
+                 messages_per_second: float = 1.0):
         """
         Initialize Telegram notifier.
         
         Args:
             bot_token: Telegram bot token from BotFather
             chat_id: Telegram chat ID to send messages to
+            connection_pool_size: Keep-alive connections kept for sendMessage
+            messages_per_second: Send rate to the chat (Telegram allows about 1/s per chat)
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        self._send_url = f"{self.api_url}/sendMessage"
+        self._updates_url = f"{self.api_url}/getUpdates"
+        
+        # Persistent session keeps the TLS connections to api.telegram.org warm between signals
+        self.session = self._make_session(connection_pool_size)
+        # getUpdates gets its own small pool so polling never holds a send connection
+        self._poll_session: Optional[requests.Session] = None
+        
+        # Paces concurrent sends to the chat instead of running into 429s
+        self._rate_limiter = TokenBucket(capacity=1, refill_per_sec=messages_per_second)
+        
+        # (symbol, signal type, price, minute) of recent sends, reserved while in flight
+        self._recent: OrderedDict = OrderedDict()
+        self._recent_lock = threading.Lock()
+        
+        # aiohttp session for the *_async methods (opened by start() inside the caller's loop)
+        self._async_session = None
+        
         logger.info(f"Initialized TelegramNotifier for chat {chat_id}")
     
     def send_signal(self,
@@ -64,45 +121,120 @@ class TelegramNotifier:
             timestamp: Signal timestamp (defaults to now)
         
         Returns:
-            True if sent successfully, False otherwise
+            True if sent successfully (or already sent/in flight), False otherwise
         """
         try:
             if timestamp is None:
                 timestamp = datetime.utcnow()
+            key = self._recent_key(symbol, signal_type, price, timestamp)
+            if not self._reserve_send(key):
+                logger.info(f"Skipping duplicate Telegram notification for {symbol} {signal_type}")
+                return True
             
-            # Build message
-            message = self._build_message(
-                symbol=symbol,
-                signal_type=signal_type,
-                confidence=confidence,
-                price=price,
-                stop_loss=stop_loss,
-                ichimoku_values=ichimoku_values,
-                llm_analysis=llm_analysis,
-                timestamp=timestamp
-            )
+            sent = False
+            try:
+                payload = self._signal_payload(
+                    symbol, signal_type, confidence, price, stop_loss,
+                    ichimoku_values, llm_analysis, timestamp
+                )
+                
+                # Send to Telegram
+                sent = self._send_message(payload)
+            finally:
+                if not sent:
+                    # Let a later retry go out
+                    self._release_send(key)
+            if not sent:
+                return False
             
-            # Send to Telegram
-            payload = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': 'Markdown',
-                'disable_web_page_preview': True
-            }
+            logger.info(f"Sent Telegram notification for {symbol} {signal_type}")
+            return True
             
-            response = requests.post(f"{self.api_url}/sendMessage", json=payload)
-            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to send Telegram notification: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error sending Telegram notification: {e}")
+            return False
+    
+    async def send_signal_async(self,
+                                symbol: str,
+                                signal_type: str,
+                                confidence: float,
+                                price: float,
+                                stop_loss: float,
+                                ichimoku_values: Dict,
+                                llm_analysis: Optional[str] = None,
+                                timestamp: Optional[datetime] = None) -> bool:
+        """
+        Send trading signal notification to Telegram without blocking the event loop.
+        
+        Same arguments and return value as send_signal().
+        """
+        try:
+            if timestamp is None:
+                timestamp = datetime.utcnow()
+            key = self._recent_key(symbol, signal_type, price, timestamp)
+            if not self._reserve_send(key):
+                logger.info(f"Skipping duplicate Telegram notification for {symbol} {signal_type}")
+                return True
+            
+            sent = False
+            try:
+                payload = self._signal_payload(
+                    symbol, signal_type, confidence, price, stop_loss,
+                    ichimoku_values, llm_analysis, timestamp
+                )
+                
+                sent = await self._send_message_async(payload)
+            finally:
+                if not sent:
+                    self._release_send(key)
+            if not sent:
+                return False
             
             logger.info(f"Sent Telegram notification for {symbol} {signal_type}")
             return True
             
-        except requests.exceptions.RequestException as e:
+        except ClientError as e:
             logger.error(f"Failed to send Telegram notification: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error sending Telegram notification: {e}")
             return False
     
+    def _signal_payload(self,
+                        symbol: str,
+                        signal_type: str,
+                        confidence: float,
+                        price: float,
+                        stop_loss: float,
+                        ichimoku_values: Dict,
+                        llm_analysis: Optional[str],
+                        timestamp: Optional[datetime]) -> Dict:
+        """Build the sendMessage payload for a signal."""
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        
+        # Build message
+        message = self._build_message(
+            symbol=symbol,
+            signal_type=signal_type,
+            confidence=confidence,
+            price=price,
+            stop_loss=stop_loss,
+            ichimoku_values=ichimoku_values,
+            llm_analysis=llm_analysis,
+            timestamp=timestamp
+        )
+        
+        return {
+            'chat_id': self.chat_id,
+            'text': message,
+            'parse_mode': 'HTML',
+            'disable_web_page_preview': True
+        }
+    
     def _build_message(self,
                       symbol: str,
                       signal_type: str,
@@ -112,53 +244,59 @@ class TelegramNotifier:
                       ichimoku_values: Dict,
                       llm_analysis: Optional[str],
                       timestamp: datetime) -> str:
-        """Build Telegram message with Markdown formatting."""
+        """Build Telegram message with HTML formatting (dynamic text is escaped)."""
         
         emoji = self.SIGNAL_EMOJIS.get(signal_type, '📊')
+        get = ichimoku_values.get
         
         # Header
-        message = f"{emoji} *{signal_type} Signal: {symbol}*\n"
-        message += "━━━━━━━━━━━━━━━━━━━━━\n\n"
-        
-        # Price and confidence
-        message += f"💰 *Price:* ${price:,.2f}\n"
-        message += f"📊 *Confidence:* {confidence:.1%}\n"
+        lines = [
+            f"{emoji} <b>{_escape(signal_type)} Signal: {_escape(symbol)}</b>",
+            DIVIDER,
+            "",
+            # Price and confidence
+            f"💰 <b>Price:</b> ${price:,.2f}",
+            f"📊 <b>Confidence:</b> {confidence:.1%}",
+        ]
         # Include stop loss only for entry signals
-        if signal_type in ['LONG', 'SHORT'] and isinstance(stop_loss, (int, float)):
-            message += f"🛡️ *Stop Loss (4%):* ${stop_loss:,.2f}\n\n"
-        else:
-            message += "\n"
+        if signal_type in ('LONG', 'SHORT') and isinstance(stop_loss, (int, float)):
+            lines.append(f"🛡️ <b>Stop Loss (4%):</b> ${stop_loss:,.2f}")
+        lines.append("")
         
         # Ichimoku indicators
-        tenkan = ichimoku_values.get('tenkan_sen')
-        kijun = ichimoku_values.get('kijun_sen')
-        cloud_color = ichimoku_values.get('cloud_color', 'unknown')
+        tenkan = get('tenkan_sen')
+        kijun = get('kijun_sen')
+        cloud_color = get('cloud_color', 'unknown')
         
         if tenkan is not None and kijun is not None:
-            message += "📈 *Ichimoku Indicators*\n"
-            message += f"  • Tenkan-sen: ${tenkan:,.2f}\n"
-            message += f"  • Kijun-sen: ${kijun:,.2f}\n"
-            message += f"  • Cloud: {cloud_color.capitalize()}\n\n"
+            lines += (
+                "📈 <b>Ichimoku Indicators</b>",
+                f"  • Tenkan-sen: ${tenkan:,.2f}",
+                f"  • Kijun-sen: ${kijun:,.2f}",
+                f"  • Cloud: {_escape(cloud_color.capitalize())}",
+                "",
+            )
         
         # Cloud boundaries
-        cloud_top = ichimoku_values.get('cloud_top')
-        cloud_bottom = ichimoku_values.get('cloud_bottom')
+        cloud_top = get('cloud_top')
+        cloud_bottom = get('cloud_bottom')
         
         if cloud_top is not None and cloud_bottom is not None:
-            message += "☁️ *Cloud Boundaries*\n"
-            message += f"  • Top: ${cloud_top:,.2f}\n"
-            message += f"  • Bottom: ${cloud_bottom:,.2f}\n\n"
+            lines += (
+                "☁️ <b>Cloud Boundaries</b>",
+                f"  • Top: ${cloud_top:,.2f}",
+                f"  • Bottom: ${cloud_bottom:,.2f}",
+                "",
+            )
         
         # LLM Analysis
         if llm_analysis:
-            message += "🤖 *AI Analysis*\n"
-            message += f"{llm_analysis}\n\n"
+            lines += ("🤖 <b>AI Analysis</b>", _escape(llm_analysis), "")
         
         # Timestamp
-        time_str = timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')
-        message += f"🕐 {time_str}"
+        lines.append(f"🕐 {timestamp:%Y-%m-%d %H:%M:%S UTC}")
         
-        return message
+        return "\n".join(lines)
     
     def send_test_message(self) -> bool:
         """
@@ -173,8 +311,26 @@ class TelegramNotifier:
                 'text': '✅ Telegram bot connection test successful!'
             }
             
-            response = requests.post(f"{self.api_url}/sendMessage", json=payload)
-            response.raise_for_status()
+            if not self._send_message(payload):
+                return False
+            
+            logger.info("Telegram test message sent successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send Telegram test message: {e}")
+            return False
+    
+    async def send_test_message_async(self) -> bool:
+        """Send a test message without blocking the event loop (see send_test_message())."""
+        try:
+            payload = {
+                'chat_id': self.chat_id,
+                'text': '✅ Telegram bot connection test successful!'
+            }
+            
+            if not await self._send_message_async(payload):
+                return False
             
             logger.info("Telegram test message sent successfully")
             return True
@@ -183,29 +339,199 @@ class TelegramNotifier:
             logger.error(f"Failed to send Telegram test message: {e}")
             return False
     
-    def get_chat_id(self) -> Optional[str]:
+    def get_chat_id(self, refresh: bool = False) -> Optional[str]:
         """
         Helper method to get chat ID from recent updates.
         Useful for initial bot setup.
         
+        Chat IDs found through getUpdates are saved to a small JSON file, so
+        later calls (and restarts) don't depend on Telegram's 24h update window.
+        
+        Args:
+            refresh: Query getUpdates even if a chat ID is already cached
+        
         Returns:
             Most recent chat ID or None
         """
+        if not refresh:
+            chat_id = self.cached_chat_id(self.bot_token)
+            if chat_id:
+                logger.info(f"Using cached chat ID: {chat_id}")
+                return chat_id
+        
         try:
-            response = requests.get(f"{self.api_url}/getUpdates")
-            response.raise_for_status()
-            
+            if self._poll_session is None:
+                self._poll_session = self._make_session(4, method='GET')
+            response = self._poll_session.get(self._updates_url, timeout=self.REQUEST_TIMEOUT)
             data = response.json()
+            if response.status_code >= 400:
+                self._check_response(response.status_code, response.headers, data)
+                return self.cached_chat_id(self.bot_token)
+            
             if data.get('ok') and data.get('result'):
                 updates = data['result']
                 if updates:
-                    chat_id = updates[-1]['message']['chat']['id']
+                    chat_id = str(updates[-1]['message']['chat']['id'])
                     logger.info(f"Found chat ID: {chat_id}")
-                    return str(chat_id)
+                    self._cache_chat_id(chat_id)
+                    return chat_id
             
             logger.warning("No chat updates found")
-            return None
+            return self.cached_chat_id(self.bot_token)
             
         except Exception as e:
             logger.error(f"Failed to get chat ID: {e}")
-            return None
+            return self.cached_chat_id(self.bot_token)
+    
+    @staticmethod
+    def _load_chat_ids() -> Dict[str, list]:
+        """Read the chat ID cache ({bot id: [chat ids, oldest first]})."""
+        try:
+            with open(CHAT_ID_CACHE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @classmethod
+    def cached_chat_id(cls, bot_token: str) -> Optional[str]:
+        """
+        Most recently discovered chat ID for a bot, without any network call.
+        
+        Args:
+            bot_token: Telegram bot token (only its public bot id is used as key)
+        
+        Returns:
+            Cached chat ID or None
+        """
+        chat_ids = cls._load_chat_ids().get(_bot_id(bot_token))
+        return chat_ids[-1] if chat_ids else None
+    
+    def _cache_chat_id(self, chat_id: str):
+        """Remember a discovered chat ID as the bot's most recent one."""
+        cache = self._load_chat_ids()
+        bot_id = _bot_id(self.bot_token)
+        cache[bot_id] = [c for c in cache.get(bot_id, []) if c != chat_id] + [chat_id]
+        try:
+            CHAT_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = CHAT_ID_CACHE.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_file, CHAT_ID_CACHE)
+        except OSError as e:
+            logger.warning(f"Could not cache chat ID: {e}")
+    
+    @staticmethod
+    def _recent_key(symbol: str, signal_type: str, price: float, timestamp: datetime) -> tuple:
+        """Identity of a notification: same symbol, signal, price and minute."""
+        return symbol, signal_type, round(price, 2), timestamp.replace(second=0, microsecond=0)
+    
+    def _reserve_send(self, key: tuple) -> bool:
+        """Claim key for sending; False if it was already sent or is in flight."""
+        with self._recent_lock:
+            if key in self._recent:
+                return False
+            self._recent[key] = None
+            if len(self._recent) > self.RECENT_SENDS:
+                self._recent.popitem(last=False)
+            return True
+    
+    def _release_send(self, key: tuple):
+        """Drop a reservation whose send failed."""
+        with self._recent_lock:
+            self._recent.pop(key, None)
+    
+    def _send_message(self, payload: Dict) -> bool:
+        """
+        POST a sendMessage payload once a rate-limit token is available.
+        
+        Returns:
+            True if Telegram accepted the message, False otherwise (already logged)
+        """
+        self._rate_limiter.acquire()
+        response = self.session.post(
+            self._send_url,
+            data=self._encode(payload),
+            headers=self.JSON_HEADERS,
+            timeout=self.REQUEST_TIMEOUT
+        )
+        if response.status_code < 400:
+            return True
+        try:
+            error = response.json()
+        except ValueError:
+            error = {}
+        return self._check_response(response.status_code, response.headers, error)
+    
+    async def _send_message_async(self, payload: Dict) -> bool:
+        """Async counterpart of _send_message() on the aiohttp session."""
+        await self.start()
+        await self._rate_limiter.acquire_async()
+        async with self._async_session.post(
+            self._send_url, data=self._encode(payload), headers=self.JSON_HEADERS
+        ) as response:
+            if response.status < 400:
+                return True
+            try:
+                error = await response.json(content_type=None)
+            except ValueError:
+                error = {}
+            return self._check_response(response.status, response.headers, error)
+    
+    def _check_response(self, status: int, headers, error: Dict) -> bool:
+        """
+        Check a Bot API response status without raising.
+        
+        Transient failures were already retried by the session's adapter. On a
+        final 429, further sends are held until Telegram's retry_after.
+        
+        Args:
+            status: HTTP status code
+            headers: Response headers
+            error: Decoded response body (Telegram's {ok, error_code, description, ...})
+        
+        Returns:
+            True for a successful status, False otherwise
+        """
+        if status < 400:
+            return True
+        if status == 429:
+            retry_after = (
+                parse_retry_after(headers)
+                or (error.get('parameters') or {}).get('retry_after')
+                or 1.0
+            )
+            self._rate_limiter.drain_until(time.monotonic() + retry_after)
+            logger.warning(f"Telegram rate limit hit, pausing sends for {retry_after:.0f}s")
+        logger.error(f"Telegram API error {status}: {error.get('description', 'no description')}")
+        return False
+    
+    @staticmethod
+    def _make_session(pool_size: int, method: str = 'POST') -> requests.Session:
+        """Session with a keep-alive pool of pool_size connections and retries for method."""
+        session = requests.Session()
+        # A 500 on sendMessage may already have posted, so POSTs only retry rate
+        # limits / gateway errors; getUpdates is read-only and also retries 500
+        statuses = (429, 502, 503, 504) if method == 'POST' else (429, 500, 502, 503, 504)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=statuses,
+            allowed_methods=frozenset({method}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry))
+        return session
+    
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+        if self._poll_session is not None:
+            self._poll_session.close()
+            self._poll_session = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -13,6 +13,7 @@ Environment variables expected:
 - TELEGRAM_CHAT_ID
 """
 
+import asyncio
 import os
 import sys
 import argparse
@@ -28,7 +29,16 @@ from notifications.discord_notifier import DiscordNotifier  # noqa: E402
 from notifications.telegram_notifier import TelegramNotifier  # noqa: E402
 
 
-def main():
+async def _send_test(notifier):
+    """Send one channel's test message, closing its sessions afterwards."""
+    try:
+        return await notifier.send_test_message_async()
+    finally:
+        await notifier.aclose()
+        notifier.close()
+
+
+async def main():
     parser = argparse.ArgumentParser(description="Send test message to Discord and/or Telegram")
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--discord", action="store_true", help="Send only to Discord")
@@ -39,8 +49,8 @@ def main():
     # Load .env if present
     load_dotenv()
 
-    sent_any = False
     errors = []
+    channels = {}
 
     # Decide targets
     targets = ["discord", "telegram"] if (args.both or (not args.discord and not args.telegram)) else (
@@ -50,12 +60,7 @@ def main():
     if "discord" in targets:
         webhook = os.getenv("DISCORD_WEBHOOK_URL")
         if webhook:
-            notifier = DiscordNotifier(webhook)
-            ok = notifier.send_test_message()
-            print("Discord: OK" if ok else "Discord: FAILED")
-            sent_any = sent_any or ok
-            if not ok:
-                errors.append("Discord webhook request failed")
+            channels["Discord"] = DiscordNotifier(webhook)
         else:
             print("Discord: SKIPPED (DISCORD_WEBHOOK_URL not set)")
 
@@ -63,12 +68,7 @@ def main():
         token = os.getenv("TELEGRAM_BOT_TOKEN")
         chat_id = os.getenv("TELEGRAM_CHAT_ID")
         if token and chat_id:
-            notifier = TelegramNotifier(token, chat_id)
-            ok = notifier.send_test_message()
-            print("Telegram: OK" if ok else "Telegram: FAILED")
-            sent_any = sent_any or ok
-            if not ok:
-                errors.append("Telegram sendMessage request failed")
+            channels["Telegram"] = TelegramNotifier(token, chat_id)
         else:
             missing = []
             if not token:
@@ -77,9 +77,21 @@ def main():
                 missing.append("TELEGRAM_CHAT_ID")
             print(f"Telegram: SKIPPED ({' & '.join(missing)} not set)")
 
-    if not sent_any and errors:
+    # Fan out to all channels at once; total time is the slowest channel, not the sum
+    results = await asyncio.gather(*(_send_test(n) for n in channels.values()))
+
+    failures = {
+        "Discord": "Discord webhook request failed",
+        "Telegram": "Telegram sendMessage request failed",
+    }
+    for name, ok in zip(channels, results):
+        print(f"{name}: OK" if ok else f"{name}: FAILED")
+        if not ok:
+            errors.append(failures[name])
+
+    if not any(results) and errors:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -11,17 +11,186 @@ Signal Architecture:
 - Designed for monitoring/alerting (not automated trading)
 """
 
+import re
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Union, Any
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Mapping, Optional, Tuple, Union, Any
 import logging
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from types import MappingProxyType
+
+try:
+    import bottleneck as bn
+    _HAS_BOTTLENECK = True
+except Exception:
+    _HAS_BOTTLENECK = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _as_float(values, dtype=None) -> np.ndarray:
+    """
+    Column (Series or array) as a float array for the indicator math.
+
+    With dtype None, float32 inputs stay float32 and anything else is float64.
+    """
+    arr = np.asarray(values)
+    if dtype is None:
+        dtype = np.float32 if arr.dtype == np.float32 else np.float64
+    return arr.astype(dtype, copy=False)
+
+
+def _rolling_midpoints(high: np.ndarray, low: np.ndarray, windows: Tuple[int, ...]) -> List[np.ndarray]:
+    """
+    (rolling max of high + rolling min of low) / 2 for each window, min_periods=1 semantics.
+
+    Windows run along the last axis, so (symbols, bars) inputs are handled in one call.
+    Results keep the dtype of high/low (bottleneck supports float32 and float64).
+    """
+    if _HAS_BOTTLENECK:
+        n = high.shape[-1]
+        if n == 0:
+            return [np.empty(high.shape, dtype=high.dtype) for _ in windows]
+        # bottleneck rejects windows longer than the input; with min_count=1 that's an expanding max/min
+        return [
+            (bn.move_max(high, min(w, n), min_count=1) + bn.move_min(low, min(w, n), min_count=1)) * 0.5
+            for w in windows
+        ]
+    return [(_swv_max(high, w) + _swv_min(low, w)) * 0.5 for w in windows]
+
+
+def _edge_padded_windows(a: np.ndarray, window: int) -> np.ndarray:
+    """
+    Length-window views (along the last axis) ending at each element of a.
+
+    The front is padded with window - 1 copies of the first element, so a max/min
+    over each view equals pandas' rolling(window, min_periods=1) result.
+    """
+    if a.shape[-1] == 0:
+        return a[..., np.newaxis]
+    padded = np.concatenate((np.repeat(a[..., :1], window - 1, axis=-1), a), axis=-1)
+    return sliding_window_view(padded, window, axis=-1)
+
+
+def _swv_max(a: np.ndarray, window: int) -> np.ndarray:
+    """Rolling max with min_periods=1 semantics (NaNs skipped, like pandas)."""
+    return np.fmax.reduce(_edge_padded_windows(a, window), axis=-1)
+
+
+def _swv_min(a: np.ndarray, window: int) -> np.ndarray:
+    """Rolling min with min_periods=1 semantics (NaNs skipped, like pandas)."""
+    return np.fmin.reduce(_edge_padded_windows(a, window), axis=-1)
+
+
+def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """NumPy equivalent of Series.shift(periods) along the last axis, periods >= 0 (NaN-filled)."""
+    if values.dtype.kind != 'f':
+        values = values.astype(np.float64)
+    n = values.shape[-1]
+    periods = min(periods, n)
+    out = np.empty_like(values)
+    out[..., :periods] = np.nan
+    out[..., periods:] = values[..., :n - periods]
+    return out
+
+
+def _compare_lagged(op, current: np.ndarray, past: np.ndarray, lag: int, out: np.ndarray):
+    """out[i] = op(current[i], past[i - lag]); rows without a lagged value are False."""
+    lag = min(max(lag, 0), len(current))
+    out[:lag] = False
+    op(current[lag:], past[:len(past) - lag], out=out[lag:])
+
+
+# StrategyRules rule sets, in evaluation order
+RULE_NAMES = ('long_entry', 'short_entry', 'long_exit', 'short_exit')
+
+
+def row_signal_bits(row: Mapping[str, Any]) -> int:
+    """A bar's packed signal bits from its signal_bits value or, if absent, its bool columns."""
+    bits = row.get('signal_bits')
+    if bits is not None:
+        return int(bits)
+    bits = 0
+    for column, bit in SIGNAL_BITS.items():
+        if row.get(column, False):
+            bits |= bit
+    return bits
+
+
+def evaluate_rule_masks(packed: np.ndarray, masks, is_and) -> np.ndarray:
+    """
+    Evaluate several condition masks against packed signal bits for every bar at once.
+
+    Args:
+        packed: signal_bits per bar
+        masks: SIGNAL_BITS mask per rule (0 = no conditions, never true)
+        is_and: Per rule, True for AND logic (all bits set), False for OR (any bit set)
+
+    Returns:
+        Bool array of shape (len(masks), len(packed))
+    """
+    masks = np.asarray(masks, dtype=np.uint16)[:, np.newaxis]
+    is_and = np.asarray(is_and, dtype=bool)[:, np.newaxis]
+    hits = np.asarray(packed, dtype=np.uint16) & masks
+    result = np.where(is_and, hits == masks, hits != 0)
+    result &= masks != 0
+    return result
+
+
+# Market state float fields -> source column, for _get_market_state
+_MARKET_STATE_FLOATS = {
+    'close_price': 'close',
+    'tenkan_sen': 'tenkan_sen',
+    'kijun_sen': 'kijun_sen',
+    'senkou_span_a': 'senkou_span_a',
+    'senkou_span_b': 'senkou_span_b',
+    'cloud_top': 'cloud_top',
+    'cloud_bottom': 'cloud_bottom',
+}
+
+
+def _pack_signal_bits(signals: np.ndarray, cols: Mapping[str, Any]) -> np.ndarray:
+    """
+    Pack the (n, 8) bool signal matrix plus the span relationship columns into uint16.
+
+    Args:
+        signals: Bool matrix in BOOLEAN_SIGNAL_COLUMNS order
+        cols: DataFrame or {column: array} dict holding the span relationship columns
+
+    Bit positions follow SIGNAL_BITS; missing span columns leave their bits clear.
+    """
+    packed = np.packbits(signals, axis=1, bitorder='little')[:, 0].astype(np.uint16)
+    for column in ('span_a_above_span_b', 'span_a_below_span_b'):
+        if column in cols:
+            packed[np.asarray(cols[column], dtype=bool)] |= SIGNAL_BITS[column]
+    return packed
+
+
+# Columns added by detect_boolean_signals, in fill order
+BOOLEAN_SIGNAL_COLUMNS = (
+    'price_above_cloud', 'price_below_cloud',
+    'tenkan_above_kijun', 'tenkan_below_kijun',
+    'chikou_above_price', 'chikou_below_price',
+    'chikou_above_cloud', 'chikou_below_cloud',
+)
+
+# Bit per signal column in the packed uint16 signal_bits column
+SIGNAL_BITS = {
+    column: 1 << i
+    for i, column in enumerate(BOOLEAN_SIGNAL_COLUMNS + ('span_a_above_span_b', 'span_a_below_span_b'))
+}
+
+
+def cloud_color(cloud_bullish: Optional[bool]) -> str:
+    """Visualization label for a cloud_bullish value ('unknown' when missing)."""
+    if cloud_bullish is None:
+        return 'unknown'
+    return 'green' if cloud_bullish else 'red'
+
+
 class SignalType(Enum):
     """Enumeration of available Ichimoku signal types (snake_case for consistency)."""
     PRICE_ABOVE_CLOUD = "price_above_cloud"
@@ -36,6 +205,32 @@ class SignalType(Enum):
     CHIKOU_BELOW_CLOUD = "chikou_below_cloud"
 
 
+# SignalType -> signal column name
+SIGNAL_COLUMNS = MappingProxyType({
+    SignalType.PRICE_ABOVE_CLOUD: 'price_above_cloud',
+    SignalType.PRICE_BELOW_CLOUD: 'price_below_cloud',
+    SignalType.TENKAN_ABOVE_KIJUN: 'tenkan_above_kijun',
+    SignalType.TENKAN_BELOW_KIJUN: 'tenkan_below_kijun',
+    SignalType.SPAN_A_ABOVE_SPAN_B: 'span_a_above_span_b',
+    SignalType.SPAN_A_BELOW_SPAN_B: 'span_a_below_span_b',
+    SignalType.CHIKOU_ABOVE_PRICE: 'chikou_above_price',
+    SignalType.CHIKOU_BELOW_PRICE: 'chikou_below_price',
+    SignalType.CHIKOU_ABOVE_CLOUD: 'chikou_above_cloud',
+    SignalType.CHIKOU_BELOW_CLOUD: 'chikou_below_cloud'
+})
+
+# Component columns detect_boolean_signals requires
+_ICHIMOKU_COLUMNS = frozenset({'tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b', 'chikou_span'})
+
+# {(window, dtype): rolling midpoint} shared by calls in one parameter sweep over a frame
+MidpointMemo = Dict[Tuple[int, Optional[str]], np.ndarray]
+
+# Snake_case signal name -> SignalType, for parse_signal_list
+_SIGNAL_NAMES = {s.value: s for s in SignalType}
+_SNAKE_CASE = str.maketrans({' ': '_', '-': '_'})
+_UNDERSCORE_RUNS = re.compile(r'_{2,}')
+
+
 @dataclass
 class IchimokuParameters:
     """Ichimoku calculation parameters."""
@@ -44,6 +239,25 @@ class IchimokuParameters:
     senkou_b_period: int = 52
     chikou_offset: int = 26
     senkou_offset: int = 26
+    # Float dtype for the computed components ('float32' or 'float64');
+    # None keeps float32 input as float32 and uses float64 otherwise
+    dtype: Optional[str] = None
+
+
+class Logic(IntEnum):
+    """How a rule combines its conditions."""
+    AND = 0
+    OR = 1
+
+    @classmethod
+    def parse(cls, value: Union[str, 'Logic']) -> 'Logic':
+        """Convert a config value ("AND"/"OR", any case) to Logic."""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).strip().upper()]
+        except KeyError:
+            raise ValueError(f"Unknown rule logic: {value!r} (expected AND or OR)") from None
 
 
 @dataclass
@@ -53,10 +267,23 @@ class StrategyRules:
     short_entry: List[SignalType]
     long_exit: List[SignalType]
     short_exit: List[SignalType]
-    long_entry_logic: str = "AND"
-    short_entry_logic: str = "AND"
-    long_exit_logic: str = "AND"
-    short_exit_logic: str = "AND"
+    # "AND"/"OR" strings are accepted and converted to Logic
+    long_entry_logic: Logic = Logic.AND
+    short_entry_logic: Logic = Logic.AND
+    long_exit_logic: Logic = Logic.AND
+    short_exit_logic: Logic = Logic.AND
+    # SIGNAL_BITS mask of each rule's conditions, resolved once at construction
+    rule_masks: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rule_masks = {}
+        for name in RULE_NAMES:
+            logic_field = f"{name}_logic"
+            setattr(self, logic_field, Logic.parse(getattr(self, logic_field)))
+            mask = 0
+            for condition in getattr(self, name):
+                mask |= SIGNAL_BITS[SIGNAL_COLUMNS[condition]]
+            self.rule_masks[name] = mask
 
 
 class UnifiedIchimokuAnalyzer:
@@ -70,92 +297,175 @@ class UnifiedIchimokuAnalyzer:
     - Comprehensive analysis for strategy evaluation
     """
 
-    def __init__(self):
-        """Initialize the analyzer with default parameters."""
-        self.signal_mapping = {
-            SignalType.PRICE_ABOVE_CLOUD: 'price_above_cloud',
-            SignalType.PRICE_BELOW_CLOUD: 'price_below_cloud',
-            SignalType.TENKAN_ABOVE_KIJUN: 'tenkan_above_kijun',
-            SignalType.TENKAN_BELOW_KIJUN: 'tenkan_below_kijun',
-            SignalType.SPAN_A_ABOVE_SPAN_B: 'span_a_above_span_b',
-            SignalType.SPAN_A_BELOW_SPAN_B: 'span_a_below_span_b',
-            SignalType.CHIKOU_ABOVE_PRICE: 'chikou_above_price',
-            SignalType.CHIKOU_BELOW_PRICE: 'chikou_below_price',
-            SignalType.CHIKOU_ABOVE_CLOUD: 'chikou_above_cloud',
-            SignalType.CHIKOU_BELOW_CLOUD: 'chikou_below_cloud'
-        }
+    # SignalType -> signal column name (shared, read-only)
+    signal_mapping = SIGNAL_COLUMNS
 
     def calculate_ichimoku_components(self,
                                       df: pd.DataFrame,
-                                      parameters: IchimokuParameters) -> pd.DataFrame:
+                                      parameters: IchimokuParameters,
+                                      midpoints: Optional[MidpointMemo] = None) -> pd.DataFrame:
         """
         Calculate all Ichimoku Cloud components with given parameters.
 
         Args:
             df: DataFrame with OHLCV data
             parameters: Ichimoku calculation parameters
+            midpoints: Optional dict kept by the caller across a parameter sweep
+                over this same df; rolling windows already in it are reused
 
         Returns:
             DataFrame with Ichimoku components added
         """
+        cols = self._components(df, parameters, midpoints)
+
+        # Input columns are shared with df (copy-on-write), not copied; components
+        # already present (e.g. from an earlier call) are replaced, not duplicated
+        result_df = pd.concat(
+            [df.drop(columns=list(cols), errors='ignore'), pd.DataFrame(cols, index=df.index, copy=False)],
+            axis=1,
+        )
+        logger.info(f"Calculated Ichimoku indicators for {len(result_df)} data points")
+        return result_df
+
+    def calculate_signals(self,
+                          df: pd.DataFrame,
+                          parameters: IchimokuParameters,
+                          midpoints: Optional[MidpointMemo] = None) -> pd.DataFrame:
+        """
+        Calculate Ichimoku components and boolean signals in one pass.
+
+        Same result as detect_boolean_signals(calculate_ichimoku_components(df)),
+        but the signals are computed from the component arrays directly and the
+        output frame is assembled once.
+
+        Args:
+            df: DataFrame with OHLCV data
+            parameters: Ichimoku calculation parameters
+            midpoints: Optional sweep memo, as in calculate_ichimoku_components
+
+        Returns:
+            DataFrame with Ichimoku components and boolean signal columns added
+        """
+        cols = self._components(df, parameters, midpoints)
+        signals = self._signal_frame(
+            {**cols, 'close': df['close'].to_numpy()}, df.index, parameters.chikou_offset
+        )
+
+        # Replace any component/signal columns df already carries
+        stale = [*cols, *signals.columns]
+        result_df = pd.concat(
+            [df.drop(columns=stale, errors='ignore'), pd.DataFrame(cols, index=df.index, copy=False), signals],
+            axis=1,
+        )
+        logger.info(f"Calculated Ichimoku indicators for {len(result_df)} data points")
+        return result_df
+
+    def _components(self,
+                    df: pd.DataFrame,
+                    parameters: IchimokuParameters,
+                    midpoints: Optional[MidpointMemo] = None) -> Dict[str, np.ndarray]:
+        """Validate df and compute the {column: array} dict of Ichimoku components."""
         # Input validation
         required_columns = ['high', 'low', 'close']
         missing_columns = set(required_columns) - set(df.columns)
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
 
-        result_df = df.copy()
+        windows = (parameters.tenkan_period, parameters.kijun_period, parameters.senkou_b_period)
+        if midpoints is None:
+            tenkan, kijun, senkou_b_raw = _rolling_midpoints(
+                _as_float(df['high'], parameters.dtype), _as_float(df['low'], parameters.dtype), windows
+            )
+        else:
+            tenkan, kijun, senkou_b_raw = self._memoized_midpoints(df, parameters.dtype, windows, midpoints)
+            # The memoized midpoints are copied so writes to the result can't reach them
+            tenkan, kijun = tenkan.copy(), kijun.copy()
+
+        return self._component_arrays(
+            tenkan, kijun, senkou_b_raw, _as_float(df['close'], parameters.dtype), parameters
+        )
+
+    def calculate_ichimoku_components_batch(self,
+                                            ohlc: np.ndarray,
+                                            parameters: IchimokuParameters) -> Dict[str, np.ndarray]:
+        """
+        Calculate Ichimoku components for several equally long series at once.
+
+        Every rolling window, shift and comparison runs over the whole
+        (symbols, bars) block in one vectorized call instead of once per symbol.
+
+        Args:
+            ohlc: Array of shape (symbols, bars, 3) holding high, low, close
+            parameters: Ichimoku calculation parameters
 
-        # Calculate core components
-        # Tenkan-sen
-        high_tenkan = result_df['high'].rolling(window=parameters.tenkan_period, min_periods=1).max()
-        low_tenkan = result_df['low'].rolling(window=parameters.tenkan_period, min_periods=1).min()
-        result_df['tenkan_sen'] = (high_tenkan + low_tenkan) / 2
+        Returns:
+            Dictionary mapping component name (as in calculate_ichimoku_components)
+            to a (symbols, bars) array
+        """
+        ohlc = np.asarray(ohlc)
+        if ohlc.ndim != 3 or ohlc.shape[-1] != 3:
+            raise ValueError(f"Expected a (symbols, bars, 3) high/low/close array, got shape {ohlc.shape}")
 
-        # Kijun-sen
-        high_kijun = result_df['high'].rolling(window=parameters.kijun_period, min_periods=1).max()
-        low_kijun = result_df['low'].rolling(window=parameters.kijun_period, min_periods=1).min()
-        result_df['kijun_sen'] = (high_kijun + low_kijun) / 2
+        # Contiguous per-symbol rows so each window scans adjacent memory
+        high, low, close = (
+            np.ascontiguousarray(_as_float(ohlc[..., i], parameters.dtype)) for i in range(3)
+        )
+        tenkan, kijun, senkou_b_raw = _rolling_midpoints(
+            high, low, (parameters.tenkan_period, parameters.kijun_period, parameters.senkou_b_period)
+        )
+        return self._component_arrays(tenkan, kijun, senkou_b_raw, close, parameters)
 
-        # Senkou Span A
-        senkou_a_raw = (result_df['tenkan_sen'] + result_df['kijun_sen']) / 2
-        result_df['senkou_span_a'] = senkou_a_raw.shift(parameters.senkou_offset)
+    def _component_arrays(self,
+                          tenkan: np.ndarray,
+                          kijun: np.ndarray,
+                          senkou_b_raw: np.ndarray,
+                          close: np.ndarray,
+                          parameters: IchimokuParameters) -> Dict[str, np.ndarray]:
+        """Build the {column: array} dict of components from the rolling midpoints."""
+        cols = {'tenkan_sen': tenkan, 'kijun_sen': kijun}
 
-        # Senkou Span B
-        high_senkou = result_df['high'].rolling(window=parameters.senkou_b_period, min_periods=1).max()
-        low_senkou = result_df['low'].rolling(window=parameters.senkou_b_period, min_periods=1).min()
-        senkou_b_raw = (high_senkou + low_senkou) / 2
-        result_df['senkou_span_b'] = senkou_b_raw.shift(parameters.senkou_offset)
+        # Senkou spans are projected senkou_offset bars forward
+        cols['senkou_span_a'] = _shift((tenkan + kijun) / 2, parameters.senkou_offset)
+        cols['senkou_span_b'] = _shift(senkou_b_raw, parameters.senkou_offset)
 
-        # Chikou Span
         # Chikou Span (lagging): past close at current index
-        result_df['chikou_span'] = result_df['close'].shift(parameters.chikou_offset)
+        cols['chikou_span'] = _shift(close, parameters.chikou_offset)
 
         # Calculate derived metrics
-        result_df = self._calculate_derived_metrics(result_df)
+        self._calculate_derived_metrics(cols)
+        return cols
 
-        logger.info(f"Calculated Ichimoku indicators for {len(result_df)} data points")
-        return result_df
-
-    def _calculate_derived_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate derived Ichimoku metrics."""
-        result_df = df.copy()
+    @staticmethod
+    def _memoized_midpoints(df: pd.DataFrame,
+                            dtype: Optional[str],
+                            windows: Tuple[int, ...],
+                            memo: MidpointMemo) -> List[np.ndarray]:
+        """Midpoints for windows, computing only those missing from memo (and adding them)."""
+        missing = [w for w in dict.fromkeys(windows) if (w, dtype) not in memo]
+        if missing:
+            # Rolling highs/lows for the missing windows from one pass over high/low
+            computed = _rolling_midpoints(_as_float(df['high'], dtype), _as_float(df['low'], dtype), missing)
+            for w, midpoint in zip(missing, computed):
+                memo[(w, dtype)] = midpoint
+
+        return [memo[(w, dtype)] for w in windows]
+
+    def _calculate_derived_metrics(self, cols: Dict[str, np.ndarray]):
+        """Add derived Ichimoku metrics to a {column: array} dict in place."""
+        span_a = cols['senkou_span_a']
+        span_b = cols['senkou_span_b']
 
         # Cloud boundaries
-        result_df['cloud_top'] = result_df[['senkou_span_a', 'senkou_span_b']].max(axis=1)
-        result_df['cloud_bottom'] = result_df[['senkou_span_a', 'senkou_span_b']].min(axis=1)
-        result_df['cloud_thickness'] = abs(result_df['senkou_span_a'] - result_df['senkou_span_b'])
+        cols['cloud_top'] = np.maximum(span_a, span_b)
+        cols['cloud_bottom'] = np.minimum(span_a, span_b)
+        cols['cloud_thickness'] = cols['cloud_top'] - cols['cloud_bottom']
 
-        # Cloud color for visualization
-        result_df['cloud_color'] = np.where(
-            result_df['senkou_span_a'] >= result_df['senkou_span_b'], 'green', 'red'
-        )
+        # Cloud color as a bool (True = green, labelled by cloud_color())
+        cols['cloud_bullish'] = span_a >= span_b
 
         # Span relationships for strategies (normalized to snake_case)
-        result_df['span_a_above_span_b'] = result_df['senkou_span_a'] > result_df['senkou_span_b']
-        result_df['span_a_below_span_b'] = result_df['senkou_span_a'] < result_df['senkou_span_b']
-
-        return result_df
+        cols['span_a_above_span_b'] = span_a > span_b
+        cols['span_a_below_span_b'] = span_a < span_b
 
     def detect_boolean_signals(self, df: pd.DataFrame, parameters: IchimokuParameters) -> pd.DataFrame:
         """
@@ -171,132 +481,171 @@ class UnifiedIchimokuAnalyzer:
         if not self._has_ichimoku_columns(df):
             raise ValueError("DataFrame must contain Ichimoku indicators")
 
-        signal_df = df.copy()
+        # Wrap the signals without copying; df's columns are shared copy-on-write
+        signals = self._signal_frame(df, df.index, parameters.chikou_offset)
+        return pd.concat([df.drop(columns=signals.columns, errors='ignore'), signals], axis=1)
 
-        # Use all rows except the last one (current incomplete bar)
-        closed_bars_mask = pd.Series(True, index=signal_df.index)
-        if len(signal_df) > 0:
-            closed_bars_mask.iloc[-1] = False
+    def _signal_frame(self, cols: Mapping[str, Any], index: pd.Index, lag: int) -> pd.DataFrame:
+        """
+        Boolean signal columns plus signal_bits, computed from component columns.
+
+        Args:
+            cols: DataFrame or {column: array} dict with close, cloud and tenkan/kijun columns
+            index: Index of the returned frame
+            lag: Chikou offset in bars
+        """
+        close = np.asarray(cols['close'])
+        cloud_top = np.asarray(cols['cloud_top'])
+        cloud_bottom = np.asarray(cols['cloud_bottom'])
+        tenkan = np.asarray(cols['tenkan_sen'])
+        kijun = np.asarray(cols['kijun_sen'])
+        n = len(close)
+
+        # One bool column per signal, filled in place (NaN compares False, as in pandas).
+        # Column-major, so each signal is a contiguous run for the ufuncs and for
+        # column reductions (pandas stores it as-is as the block's rows).
+        out = np.empty((n, len(BOOLEAN_SIGNAL_COLUMNS)), dtype=bool, order='F')
 
         # Price vs Cloud signals
-        signal_df['price_above_cloud'] = self._detect_price_above_cloud(signal_df, closed_bars_mask)
-        signal_df['price_below_cloud'] = self._detect_price_below_cloud(signal_df, closed_bars_mask)
+        np.greater(close, cloud_top, out=out[:, 0])
+        np.less(close, cloud_bottom, out=out[:, 1])
 
         # Tenkan vs Kijun signals
-        signal_df['tenkan_above_kijun'] = self._detect_tenkan_above_kijun(signal_df, closed_bars_mask)
-        signal_df['tenkan_below_kijun'] = self._detect_tenkan_below_kijun(signal_df, closed_bars_mask)
-
-        # Chikou signals (only for closed bars)
-        signal_df['chikou_above_price'] = self._detect_chikou_above_price(signal_df, closed_bars_mask, parameters)
-        signal_df['chikou_below_price'] = self._detect_chikou_below_price(signal_df, closed_bars_mask, parameters)
-        signal_df['chikou_above_cloud'] = self._detect_chikou_above_cloud(signal_df, closed_bars_mask, parameters)
-        signal_df['chikou_below_cloud'] = self._detect_chikou_below_cloud(signal_df, closed_bars_mask, parameters)
-
-        return signal_df
-
-    def _detect_price_above_cloud(self, df: pd.DataFrame, mask: pd.Series) -> pd.Series:
-        """Detect when price is above the cloud (uses precomputed cloud_top)."""
-        signal = (df["close"] > df["cloud_top"]) & mask
-        return signal.astype(bool)
-
-    def _detect_price_below_cloud(self, df: pd.DataFrame, mask: pd.Series) -> pd.Series:
-        """Detect when price is below the cloud (uses precomputed cloud_bottom)."""
-        signal = (df["close"] < df["cloud_bottom"]) & mask
-        return signal.astype(bool)
-
-    def _detect_tenkan_above_kijun(self, df: pd.DataFrame, mask: pd.Series) -> pd.Series:
-        """Detect when Tenkan is above Kijun."""
-        signal = (df["tenkan_sen"] > df["kijun_sen"]) & mask
-        return signal.astype(bool)
-
-    def _detect_tenkan_below_kijun(self, df: pd.DataFrame, mask: pd.Series) -> pd.Series:
-        """Detect when Tenkan is below Kijun."""
-        signal = (df["tenkan_sen"] < df["kijun_sen"]) & mask
-        return signal.astype(bool)
-
-    def _detect_chikou_above_price(self, df: pd.DataFrame, mask: pd.Series,
-                                   parameters: IchimokuParameters) -> pd.Series:
-        """Detect when current close is above price at chikou_offset ago."""
-        hist_price = df['close'].shift(parameters.chikou_offset)
-        signal = (df['close'] > hist_price) & mask
-        return signal.astype(bool)
-
-    def _detect_chikou_below_price(self, df: pd.DataFrame, mask: pd.Series,
-                                   parameters: IchimokuParameters) -> pd.Series:
-        """Detect when current close is below price at chikou_offset ago."""
-        hist_price = df['close'].shift(parameters.chikou_offset)
-        signal = (df['close'] < hist_price) & mask
-        return signal.astype(bool)
-
-    def _detect_chikou_above_cloud(self, df: pd.DataFrame, mask: pd.Series,
-                                   parameters: IchimokuParameters) -> pd.Series:
-        """Detect when current close is above cloud at chikou_offset ago."""
-        hist_cloud_top = df['cloud_top'].shift(parameters.chikou_offset)
-        signal = (df['close'] > hist_cloud_top) & mask
-        return signal.astype(bool)
-
-    def _detect_chikou_below_cloud(self, df: pd.DataFrame, mask: pd.Series,
-                                   parameters: IchimokuParameters) -> pd.Series:
-        """Detect when current close is below cloud at chikou_offset ago."""
-        hist_cloud_bottom = df['cloud_bottom'].shift(parameters.chikou_offset)
-        signal = (df['close'] < hist_cloud_bottom) & mask
-        return signal.astype(bool)
+        np.greater(tenkan, kijun, out=out[:, 2])
+        np.less(tenkan, kijun, out=out[:, 3])
+
+        # Chikou signals: current close vs price/cloud chikou_offset bars ago
+        _compare_lagged(np.greater, close, close, lag, out[:, 4])
+        _compare_lagged(np.less, close, close, lag, out[:, 5])
+        _compare_lagged(np.greater, close, cloud_top, lag, out[:, 6])
+        _compare_lagged(np.less, close, cloud_bottom, lag, out[:, 7])
+
+        # Use all rows except the last one (current incomplete bar)
+        if n > 0:
+            out[-1, :] = False
+
+        # Wrap out without copying
+        signals = pd.DataFrame(out, index=index, columns=list(BOOLEAN_SIGNAL_COLUMNS), copy=False)
+        signals['signal_bits'] = _pack_signal_bits(out, cols)
+        return signals
 
     def check_position_signals(self,
                                df: pd.DataFrame,
-                               rules: 'StrategyRules') -> Dict[str, Any]:
-        """Evaluate long/short entry/exit signals on the latest closed bar."""
+                               rules: 'StrategyRules',
+                               latest: Optional[Mapping[str, Any]] = None,
+                               timestamp: Optional[pd.Timestamp] = None) -> Dict[str, Any]:
+        """
+        Evaluate long/short entry/exit signals on the latest closed bar.
+
+        Args:
+            df: DataFrame with boolean signal columns
+            rules: Strategy rules to evaluate
+            latest: Values of the latest closed bar, if the caller already extracted them
+            timestamp: Index label of the latest closed bar, if the caller already has it
+        """
         if len(df) == 0:
             return {"long_entry": False, "short_entry": False, "long_exit": False, "short_exit": False, "timestamp": None}
 
         # Use latest completed bar
         latest_idx = -2 if len(df) > 1 else -1
-        latest = df.iloc[latest_idx]
+        if latest is None:
+            bits = self._bar_signal_bits(df, latest_idx)
+        else:
+            bits = row_signal_bits(latest)
 
-        def _eval(conds: List[SignalType], logic: str) -> bool:
+        def _eval(name: str) -> bool:
+            conds = getattr(rules, name)
             if not conds:
                 return False
-            values = []
-            for c in conds:
-                col = self.signal_mapping.get(c)
-                values.append(bool(latest.get(col, False)))
-            return all(values) if logic.upper() == "AND" else any(values)
-
-        return {
-            "long_entry": _eval(rules.long_entry, rules.long_entry_logic),
-            "short_entry": _eval(rules.short_entry, rules.short_entry_logic),
-            "long_exit": _eval(rules.long_exit, rules.long_exit_logic),
-            "short_exit": _eval(rules.short_exit, rules.short_exit_logic),
-            "timestamp": df.index[latest_idx]
-        }
+            mask = rules.rule_masks[name]
+            if getattr(rules, f"{name}_logic") is Logic.AND:
+                return bits & mask == mask
+            return bits & mask != 0
+
+        result: Dict[str, Any] = {name: _eval(name) for name in RULE_NAMES}
+        result["timestamp"] = df.index[latest_idx] if timestamp is None else timestamp
+        return result
+
+    @staticmethod
+    def _bar_signal_bits(df: pd.DataFrame, idx: int) -> int:
+        """
+        One bar's packed signal bits, read cell by cell instead of via df.iloc[idx].
+
+        df.iloc[idx] would box the whole (mixed-dtype) row into a Series.
+        """
+        if 'signal_bits' in df.columns:
+            return int(df['signal_bits'].iat[idx])
+        return row_signal_bits({c: df[c].iat[idx] for c in SIGNAL_BITS if c in df.columns})
+
+    def evaluate_rules_vectorized(self, df: pd.DataFrame, rules: 'StrategyRules') -> Dict[str, np.ndarray]:
+        """
+        Evaluate long/short entry/exit rules on every bar at once.
+
+        Unlike check_position_signals (latest closed bar only), this is meant for
+        backtests and parameter sweeps: each rule becomes one integer AND/compare
+        over the packed signal_bits column.
+
+        Args:
+            df: DataFrame with boolean signal columns
+            rules: Strategy rules to evaluate
+
+        Returns:
+            Dictionary mapping rule name to a bool array with one entry per bar
+        """
+        return dict(zip(RULE_NAMES, self.evaluate_rule_sets(df, [rules])[0]))
+
+    def evaluate_rule_sets(self, df: pd.DataFrame, rule_sets: List['StrategyRules']) -> np.ndarray:
+        """
+        Evaluate many strategy variants over the full history in one call.
+
+        Args:
+            df: DataFrame with boolean signal columns (signal_bits used when present)
+            rule_sets: Strategy rules to evaluate, e.g. a grid-search population
+
+        Returns:
+            Bool array of shape (len(rule_sets), 4, bars); the middle axis follows
+            RULE_NAMES (long_entry, short_entry, long_exit, short_exit)
+        """
+        if 'signal_bits' in df.columns:
+            packed = df['signal_bits'].to_numpy()
+        else:
+            packed = _pack_signal_bits(df[list(BOOLEAN_SIGNAL_COLUMNS)].to_numpy(dtype=bool), df)
+
+        masks = [rules.rule_masks[name] for rules in rule_sets for name in RULE_NAMES]
+        is_and = [getattr(rules, f"{name}_logic") is Logic.AND for rules in rule_sets for name in RULE_NAMES]
+        result = evaluate_rule_masks(packed, masks, is_and)
+        return result.reshape(len(rule_sets), len(RULE_NAMES), len(packed))
 
     def _get_market_state(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get current market state from Ichimoku data."""
         if len(df) == 0:
             return {}
 
-        latest = df.iloc[-1]
-
-        return {
-            "close_price": float(latest['close']) if pd.notna(latest['close']) else None,
-            "tenkan_sen": float(latest['tenkan_sen']) if pd.notna(latest['tenkan_sen']) else None,
-            "kijun_sen": float(latest['kijun_sen']) if pd.notna(latest['kijun_sen']) else None,
-            "senkou_span_a": float(latest['senkou_span_a']) if pd.notna(latest['senkou_span_a']) else None,
-            "senkou_span_b": float(latest['senkou_span_b']) if pd.notna(latest['senkou_span_b']) else None,
-            "cloud_top": float(latest['cloud_top']) if pd.notna(latest['cloud_top']) else None,
-            "cloud_bottom": float(latest['cloud_bottom']) if pd.notna(latest['cloud_bottom']) else None,
-            "cloud_color": latest.get('cloud_color', 'unknown'),
-            "price_above_cloud": latest.get('price_above_cloud', False),
-            "price_below_cloud": latest.get('price_below_cloud', False),
-            "tenkan_above_kijun": latest.get('tenkan_above_kijun', False),
-            "tenkan_below_kijun": latest.get('tenkan_below_kijun', False),
-            "span_a_above_span_b": latest.get('span_a_above_span_b', latest.get('SpanAaboveSpanB', False))
+        # Float fields in one vectorized read of the last row (NaN -> None)
+        values = df[list(_MARKET_STATE_FLOATS.values())].iloc[-1].to_numpy(dtype=np.float64)
+        state = {
+            key: None if np.isnan(value) else float(value)
+            for key, value in zip(_MARKET_STATE_FLOATS, values)
         }
 
+        columns = df.columns
+
+        def _last(col: str, default: Any = False) -> Any:
+            return df[col].iat[-1] if col in columns else default
+
+        state.update({
+            "cloud_color": cloud_color(_last('cloud_bullish', None)),
+            "price_above_cloud": _last('price_above_cloud'),
+            "price_below_cloud": _last('price_below_cloud'),
+            "tenkan_above_kijun": _last('tenkan_above_kijun'),
+            "tenkan_below_kijun": _last('tenkan_below_kijun'),
+            "span_a_above_span_b": _last('span_a_above_span_b', _last('SpanAaboveSpanB'))
+        })
+        return state
+
     def _has_ichimoku_columns(self, df: pd.DataFrame) -> bool:
         """Check if DataFrame has required Ichimoku columns."""
-        required = ['tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b', 'chikou_span']
-        return all(col in df.columns for col in required)
+        return _ICHIMOKU_COLUMNS.issubset(df.columns)
 
 
 # Strategy Configuration Helper
@@ -308,14 +657,16 @@ class IchimokuStrategyConfig:
                          kijun_period: int = 26,
                          senkou_b_period: int = 52,
                          chikou_offset: int = 26,
-                         senkou_offset: int = 26) -> IchimokuParameters:
+                         senkou_offset: int = 26,
+                         dtype: Optional[str] = None) -> IchimokuParameters:
         """Create Ichimoku parameters object."""
         return IchimokuParameters(
             tenkan_period=tenkan_period,
             kijun_period=kijun_period,
             senkou_b_period=senkou_b_period,
             chikou_offset=chikou_offset,
-            senkou_offset=senkou_offset
+            senkou_offset=senkou_offset,
+            dtype=dtype
         )
 
     @staticmethod
@@ -323,10 +674,10 @@ class IchimokuStrategyConfig:
                               short_entry: List[SignalType],
                               long_exit: List[SignalType],
                               short_exit: List[SignalType],
-                              long_entry_logic: str = "AND",
-                              short_entry_logic: str = "AND",
-                              long_exit_logic: str = "AND",
-                              short_exit_logic: str = "AND") -> StrategyRules:
+                              long_entry_logic: Union[str, Logic] = Logic.AND,
+                              short_entry_logic: Union[str, Logic] = Logic.AND,
+                              long_exit_logic: Union[str, Logic] = Logic.AND,
+                              short_exit_logic: Union[str, Logic] = Logic.AND) -> StrategyRules:
         """Create StrategyRules for explicit long/short entries and exits."""
         return StrategyRules(
             long_entry=long_entry,
@@ -342,30 +693,13 @@ class IchimokuStrategyConfig:
     @staticmethod
     def parse_signal_list(signal_names: List[str]) -> List[SignalType]:
         """Parse a list of signal names (snake_case standard) into SignalType enums."""
-        # Direct mapping for snake_case signals (standard format)
-        name_map = {
-            "price_above_cloud": SignalType.PRICE_ABOVE_CLOUD,
-            "price_below_cloud": SignalType.PRICE_BELOW_CLOUD,
-            "tenkan_above_kijun": SignalType.TENKAN_ABOVE_KIJUN,
-            "tenkan_below_kijun": SignalType.TENKAN_BELOW_KIJUN,
-            "span_a_above_span_b": SignalType.SPAN_A_ABOVE_SPAN_B,
-            "span_a_below_span_b": SignalType.SPAN_A_BELOW_SPAN_B,
-            "chikou_above_price": SignalType.CHIKOU_ABOVE_PRICE,
-            "chikou_below_price": SignalType.CHIKOU_BELOW_PRICE,
-            "chikou_above_cloud": SignalType.CHIKOU_ABOVE_CLOUD,
-            "chikou_below_cloud": SignalType.CHIKOU_BELOW_CLOUD,
-        }
-        
         parsed: List[SignalType] = []
         for n in signal_names:
-            # Normalize to snake_case
-            normalized = n.lower().replace(" ", "_").replace("-", "_")
-            # Remove duplicate underscores
-            while "__" in normalized:
-                normalized = normalized.replace("__", "_")
-            
-            if normalized in name_map:
-                parsed.append(name_map[normalized])
+            # Normalize to snake_case (spaces/dashes -> underscores, runs collapsed)
+            normalized = _UNDERSCORE_RUNS.sub('_', n.lower().translate(_SNAKE_CASE))
+            signal = _SIGNAL_NAMES.get(normalized)
+            if signal is not None:
+                parsed.append(signal)
             else:
                 logger.warning(f"Unknown signal name: {n} (normalized: {normalized})")
         